@@ -7,27 +7,48 @@ Usage:
     python count_lemma_types.py
 """
 
+import shutil
 import pandas as pd
 from pathlib import Path
-from urllib.request import urlretrieve
-from urllib.error import URLError
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
+
+from lexique_io import load_lemmas
 
 LEXIQUE_URL = "http://www.lexique.org/databases/Lexique383/Lexique383.tsv"
 LEXIQUE_PATH = Path("Lexique383.tsv")
 OUTPUT_PATH = Path("lemma_type_stats.csv")
 
+# Read buffer for streaming the download (4 MB)
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 def download_lexique():
-    """Download Lexique383.tsv if not present."""
+    """Download Lexique383.tsv if not present, resuming a partial download."""
     print(f"Downloading {LEXIQUE_PATH}...")
+    part_path = LEXIQUE_PATH.with_name(LEXIQUE_PATH.name + '.part')
+    existing = part_path.stat().st_size if part_path.exists() else 0
+    headers = {'Range': f'bytes={existing}-'} if existing else {}
+
     try:
-        urlretrieve(LEXIQUE_URL, LEXIQUE_PATH)
-        print(f"Downloaded: {LEXIQUE_PATH} ({LEXIQUE_PATH.stat().st_size / 1024 / 1024:.1f} MB)\n")
-        return True
+        with urlopen(Request(LEXIQUE_URL, headers=headers)) as response:
+            # Server ignored the Range header: start over
+            mode = 'ab' if existing and response.status == 206 else 'wb'
+            with open(part_path, mode) as f:
+                shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
+    except HTTPError as e:
+        # 416: the partial file is already complete
+        if not (existing and e.code == 416):
+            print(f"Download failed: {e}")
+            return False
     except URLError as e:
         print(f"Download failed: {e}")
         return False
 
+    part_path.replace(LEXIQUE_PATH)
+    print(f"Downloaded: {LEXIQUE_PATH} ({LEXIQUE_PATH.stat().st_size / 1024 / 1024:.1f} MB)\n")
+    return True
+
 
 CGRAM_NAMES = {
     'NOM': 'Noun',
@@ -57,77 +78,54 @@ CGRAM_NAMES = {
 }
 
 
-def count_distribution(series, valid_values):
-    """Count occurrences of valid values and 'unspecified'."""
-    counts = {}
-    for val in valid_values:
-        counts[val] = (series == val).sum()
-    counts['na'] = series.isna().sum() + (~series.isin(valid_values)).sum()
+def count_distribution(lemmas, column, valid_values):
+    """Count occurrences of valid values and 'unspecified' per cgram."""
+    total = lemmas['cgram'].value_counts()
+    counts = (
+        lemmas.groupby('cgram', observed=True)[column].value_counts()
+        .unstack(fill_value=0)
+        .reindex(index=total.index, columns=valid_values, fill_value=0)
+    )
+    counts['na'] = total - counts.sum(axis=1)
     return counts
 
 
-def main():
-    if not LEXIQUE_PATH.exists():
-        if not download_lexique():
-            return
-
-    # 1. Load
-    df = pd.read_csv(
-        LEXIQUE_PATH,
-        sep='\t',
-        usecols=['lemme', 'cgram', 'islem', 'genre', 'nombre'],
-        low_memory=False
-    )
-    print(f"Loaded {len(df):,} records\n")
-
-    # 2. Filter islem == 1
-    lemmas = df[df['islem'] == 1].copy()
+def main(lemmas: pd.DataFrame | None = None):
+    # 1. Load lemmas (islem == 1) unless already loaded by the caller
+    if lemmas is None:
+        if not LEXIQUE_PATH.exists():
+            if not download_lexique():
+                return
+        lemmas = load_lemmas(LEXIQUE_PATH)
     print(f"Lemmas (islem=1): {len(lemmas):,}\n")
 
     # 3. Count by cgram with gender/number distribution
-    results = []
-    for cgram in lemmas['cgram'].value_counts().index:
-        subset = lemmas[lemmas['cgram'] == cgram]
-        count = len(subset)
-
-        # Gender distribution
-        gender = count_distribution(subset['genre'], ['m', 'f'])
-
-        # Number distribution
-        number = count_distribution(subset['nombre'], ['s', 'p'])
-
-        results.append({
-            'cgram': cgram,
-            'name': CGRAM_NAMES.get(cgram, cgram),
-            'count': count,
-            'genre_m': gender['m'],
-            'genre_f': gender['f'],
-            'genre_na': gender['na'],
-            'nombre_s': number['s'],
-            'nombre_p': number['p'],
-            'nombre_na': number['na'],
-        })
-
-    stats = pd.DataFrame(results)
-
-    # 4. Print to console
-    print("=" * 120)
-    print(f"{'Code':<12} {'Name':<25} {'Count':>8}  |  {'m':>6} {'f':>6} {'n/a':>6}  |  {'s':>6} {'p':>6} {'n/a':>6}")
-    print("=" * 120)
-
-    for _, row in stats.iterrows():
-        print(
-            f"{row['cgram']:<12} {row['name']:<25} {row['count']:>8,}  |  "
-            f"{row['genre_m']:>6,} {row['genre_f']:>6,} {row['genre_na']:>6,}  |  "
-            f"{row['nombre_s']:>6,} {row['nombre_p']:>6,} {row['nombre_na']:>6,}"
-        )
-
-    print("=" * 120)
-    print(
-        f"{'TOTAL':<38} {stats['count'].sum():>8,}  |  "
-        f"{stats['genre_m'].sum():>6,} {stats['genre_f'].sum():>6,} {stats['genre_na'].sum():>6,}  |  "
-        f"{stats['nombre_s'].sum():>6,} {stats['nombre_p'].sum():>6,} {stats['nombre_na'].sum():>6,}"
-    )
+    cgram_counts = lemmas['cgram'].value_counts()
+    gender = count_distribution(lemmas, 'genre', ['m', 'f'])
+    number = count_distribution(lemmas, 'nombre', ['s', 'p'])
+
+    stats = pd.DataFrame({
+        'cgram': cgram_counts.index,
+        'name': [CGRAM_NAMES.get(cgram, cgram) for cgram in cgram_counts.index],
+        'count': cgram_counts.to_numpy(),
+        'genre_m': gender['m'].to_numpy(),
+        'genre_f': gender['f'].to_numpy(),
+        'genre_na': gender['na'].to_numpy(),
+        'nombre_s': number['s'].to_numpy(),
+        'nombre_p': number['p'].to_numpy(),
+        'nombre_na': number['na'].to_numpy(),
+    })
+
+    # 4. Print to console (with a TOTAL row)
+    count_columns = stats.columns[2:]
+    total = stats[count_columns].sum().to_frame().T.assign(cgram='TOTAL', name='')
+    table = pd.concat([stats, total], ignore_index=True)
+    formatters = {
+        'cgram': '{:<12}'.format,
+        'name': '{:<25}'.format,
+        **{col: '{:,}'.format for col in count_columns},
+    }
+    print(table.to_string(index=False, formatters=formatters))
 
     # 5. Export CSV
     stats.to_csv(OUTPUT_PATH, index=False)
@@ -135,8 +133,8 @@ def main():
 
     # 6. Legend
     print("\nLegend:")
-    print("  genre: m = masculine, f = feminine, n/a = unspecified")
-    print("  nombre: s = singular, p = plural, n/a = unspecified")
+    print("  genre_m / genre_f / genre_na = masculine / feminine / unspecified")
+    print("  nombre_s / nombre_p / nombre_na = singular / plural / unspecified")
 
 
 if __name__ == "__main__":
@@ -4,16 +4,52 @@
 French Vocabulary Anki Deck Generator v3
 """
 
+import re
+
 import genanki
 
 # Unique IDs
-VOCAB_MODEL_ID = 1607392330
+VOCAB_MODEL_ID = 1607392332  # with GenderClass; the shipped v3 .apkg used 1607392330
 CLOZE_MODEL_ID = 1607392331
 VOCAB_DECK_ID = 2059400110
 CONJ_DECK_ID = 2059400111
 
 # CSS STYLING
-VOCAB_CSS = """
+# WordType -> (text/tag color, gradient start, gradient end)
+GENDER_COLORS = {
+    'm': ('#1565c0', '#e3f2fd', '#bbdefb'),
+    'f': ('#c2185b', '#fce4ec', '#f8bbd9'),
+    'v': ('#2e7d32', '#e8f5e9', '#c8e6c9'),
+    'adj': ('#7b1fa2', '#f3e5f5', '#e1bee7'),
+    'adv': ('#00838f', '#e0f7fa', '#b2ebf2'),
+    'conj': ('#ef6c00', '#fff3e0', '#ffe0b2'),
+    'prep': ('#5d4037', '#efebe9', '#d7ccc8'),
+    'pron': ('#455a64', '#eceff1', '#cfd8dc'),
+    'num': ('#6a1b9a', '#f3e5f5', '#ce93d8'),
+    'interj': ('#d84315', '#fbe9e7', '#ffccbc'),
+    'expr': ('#00695c', '#e0f2f1', '#b2dfdb'),
+    'loc': ('#4527a0', '#ede7f6', '#d1c4e9'),
+}
+
+# Colored main word and WordType tag for each GENDER_COLORS entry
+MAIN_WORD_RULES = '\n'.join(
+    f'.main-word.gender-{wt} {{ color: {text}; background: linear-gradient(135deg, {start} 0%, {end} 100%); }}'
+    for wt, (text, start, end) in GENDER_COLORS.items()
+)
+GENDER_TAG_RULES = '\n'.join(
+    f'.gender-tag.gender-{wt} {{ background-color: {text}; color: white; }}'
+    for wt, (text, _, _) in GENDER_COLORS.items()
+)
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace (the CSS is stored in every card)."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};:,])\s*', r'\1', css).strip()
+
+
+VOCAB_CSS = minify_css("""
 .card {
     font-family: 'Segoe UI', Arial, sans-serif;
     font-size: 22px;
@@ -41,18 +77,7 @@ VOCAB_CSS = """
     background: linear-gradient(135deg, #3a3a3a 0%, #2a2a2a 100%);
     color: #f0f0f0;
 }
-.main-word.gender-m { color: #1565c0; background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%); }
-.main-word.gender-f { color: #c2185b; background: linear-gradient(135deg, #fce4ec 0%, #f8bbd9 100%); }
-.main-word.gender-v { color: #2e7d32; background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%); }
-.main-word.gender-adj { color: #7b1fa2; background: linear-gradient(135deg, #f3e5f5 0%, #e1bee7 100%); }
-.main-word.gender-adv { color: #00838f; background: linear-gradient(135deg, #e0f7fa 0%, #b2ebf2 100%); }
-.main-word.gender-conj { color: #ef6c00; background: linear-gradient(135deg, #fff3e0 0%, #ffe0b2 100%); }
-.main-word.gender-prep { color: #5d4037; background: linear-gradient(135deg, #efebe9 0%, #d7ccc8 100%); }
-.main-word.gender-pron { color: #455a64; background: linear-gradient(135deg, #eceff1 0%, #cfd8dc 100%); }
-.main-word.gender-num { color: #6a1b9a; background: linear-gradient(135deg, #f3e5f5 0%, #ce93d8 100%); }
-.main-word.gender-interj { color: #d84315; background: linear-gradient(135deg, #fbe9e7 0%, #ffccbc 100%); }
-.main-word.gender-expr { color: #00695c; background: linear-gradient(135deg, #e0f2f1 0%, #b2dfdb 100%); }
-.main-word.gender-loc { color: #4527a0; background: linear-gradient(135deg, #ede7f6 0%, #d1c4e9 100%); }
+""" + MAIN_WORD_RULES + """
 .gender-tag {
     font-size: 14px;
     padding: 3px 10px;
@@ -61,19 +86,8 @@ VOCAB_CSS = """
     font-weight: normal;
     vertical-align: middle;
 }
-.gender-tag.gender-m { background-color: #1565c0; color: white; }
-.gender-tag.gender-f { background-color: #c2185b; color: white; }
-.gender-tag.gender-v { background-color: #2e7d32; color: white; }
-.gender-tag.gender-adj { background-color: #7b1fa2; color: white; }
-.gender-tag.gender-adv { background-color: #00838f; color: white; }
-.gender-tag.gender-conj { background-color: #ef6c00; color: white; }
-.gender-tag.gender-prep { background-color: #5d4037; color: white; }
-.gender-tag.gender-pron { background-color: #455a64; color: white; }
-.gender-tag.gender-num { background-color: #6a1b9a; color: white; }
-.gender-tag.gender-interj { background-color: #d84315; color: white; }
-.gender-tag.gender-expr { background-color: #00695c; color: white; }
-.gender-tag.gender-loc { background-color: #4527a0; color: white; }
 .gender-tag.gender-other { background-color: #616161; color: white; }
+""" + GENDER_TAG_RULES + """
 
 /* Example sentence */
 .example {
@@ -133,9 +147,9 @@ hr { border: none; border-top: 2px solid #e0e0e0; margin: 25px 0; }
     text-transform: uppercase;
     letter-spacing: 1px;
 }
-"""
+""")
 
-CLOZE_CSS = """
+CLOZE_CSS = minify_css("""
 .card {
     font-family: 'Segoe UI', Arial, sans-serif;
     font-size: 22px;
@@ -187,114 +201,92 @@ CLOZE_CSS = """
     border-left: 4px solid #ffc107;
 }
 .group-label { font-size: 12px; color: #888; margin: 15px 0 5px 0; }
-"""
+""")
+
+# WordType values with their own color in VOCAB_CSS
+GENDER_TYPES = set(GENDER_COLORS)
+
+
+def gender_class(word_type: str) -> str:
+    """CSS class for the main word and WordType tag, computed once per note."""
+    wt = word_type.strip().lower()
+    return f'gender-{wt}' if wt in GENDER_TYPES else 'gender-other'
+
+
+# Class attributes for the templates. Notes with an empty GenderClass (e.g.
+# imported from a CSV without that column) fall back to gender-<WordType>;
+# GENDER_TAG_RULES come after gender-other in VOCAB_CSS, so a known WordType wins
+MAIN_WORD_CLASS = 'main-word {{GenderClass}}{{^GenderClass}}gender-{{WordType}}{{/GenderClass}}'
+GENDER_TAG_CLASS = 'gender-tag {{GenderClass}}{{^GenderClass}}gender-other gender-{{WordType}}{{/GenderClass}}'
+
 
 # TEMPLATES
-RECOG_FRONT = """
+# Shared partials, composed into the four vocabulary templates below
+DIRECTION_FR_RU = """
 <div class="direction">FR -> RU</div>
-<div class="main-word" id="main-word">
-    {{French}}{{#Audio}}<span class="audio-btn">{{Audio}}</span>{{/Audio}}<span class="gender-tag" id="gender-tag">{{WordType}}</span>
-</div>
-{{#ExampleFrench}}
-<div class="example">
-    {{ExampleFrench}}{{#AudioExample}}<span class="audio-btn">{{AudioExample}}</span>{{/AudioExample}}
-</div>
-{{/ExampleFrench}}
-<script>
-(function() {
-    var g = '{{WordType}}'.trim().toLowerCase();
-    var mainWord = document.getElementById('main-word');
-    var genderTag = document.getElementById('gender-tag');
-    var validTypes = ['m','f','v','adj','adv','conj','prep','pron','num','interj','expr','loc'];
-    if (validTypes.includes(g)) {
-        mainWord.classList.add('gender-' + g);
-        genderTag.classList.add('gender-' + g);
-    } else {
-        genderTag.classList.add('gender-other');
-    }
-})();
-</script>
 """
 
-RECOG_BACK = """
-<div class="direction">FR -> RU</div>
-<div class="main-word" id="main-word">
-    {{French}}{{#Audio}}<span class="audio-btn">{{Audio}}</span>{{/Audio}}<span class="gender-tag" id="gender-tag">{{WordType}}</span>
-</div>
-{{#ExampleFrench}}
+DIRECTION_RU_FR = """
+<div class="direction">RU -> FR</div>
+"""
+
+EMOJI = '{{#Emoji}}<span class="emoji">{{Emoji}}</span>{{/Emoji}}'
+
+FRENCH_WORD = (
+    '{{French}}{{#Audio}}<span class="audio-btn">{{Audio}}</span>{{/Audio}}'
+    '<span class="' + GENDER_TAG_CLASS + '">{{WordType}}</span>'
+)
+
+EXAMPLE_FRENCH_BLOCK = """{{#ExampleFrench}}
 <div class="example">
     {{ExampleFrench}}{{#AudioExample}}<span class="audio-btn">{{AudioExample}}</span>{{/AudioExample}}
 </div>
 {{/ExampleFrench}}
-<hr>
-<div class="translation">{{#Emoji}}<span class="emoji">{{Emoji}}</span>{{/Emoji}}{{Russian}}</div>
-{{#ExampleFrench}}
-<div class="example">
-    {{#ExampleRussian}}
-    <div class="example-translation">{{ExampleRussian}}</div>
-    {{/ExampleRussian}}
-</div>
-{{/ExampleFrench}}
-{{#Notes}}
-<div class="notes">{{Notes}}</div>
-{{/Notes}}
-<script>
-(function() {
-    var g = '{{WordType}}'.trim().toLowerCase();
-    var mainWord = document.getElementById('main-word');
-    var genderTag = document.getElementById('gender-tag');
-    var validTypes = ['m','f','v','adj','adv','conj','prep','pron','num','interj','expr','loc'];
-    if (validTypes.includes(g)) {
-        mainWord.classList.add('gender-' + g);
-        genderTag.classList.add('gender-' + g);
-    } else {
-        genderTag.classList.add('gender-other');
-    }
-})();
-</script>
 """
 
-PROD_FRONT = """
-<div class="direction">RU -> FR</div>
-<div class="main-word">{{Russian}}</div>
+RUSSIAN_WORD_BLOCK = """<div class="main-word">{{Russian}}</div>
 {{#ExampleRussian}}
 <div class="example">{{ExampleRussian}}</div>
 {{/ExampleRussian}}
 """
 
-PROD_BACK = """
-<div class="direction">RU -> FR</div>
-<div class="main-word">{{Russian}}</div>
-{{#ExampleRussian}}
-<div class="example">{{ExampleRussian}}</div>
-{{/ExampleRussian}}
-<hr>
-<div class="main-word" id="main-word">
-    {{#Emoji}}<span class="emoji">{{Emoji}}</span>{{/Emoji}}{{French}}{{#Audio}}<span class="audio-btn">{{Audio}}</span>{{/Audio}}<span class="gender-tag" id="gender-tag">{{WordType}}</span>
-</div>
-{{#ExampleFrench}}
+NOTES_BLOCK = """{{#Notes}}
+<div class="notes">{{Notes}}</div>
+{{/Notes}}
+"""
+
+
+def main_word_block(content: str) -> str:
+    """Main word container colored by GenderClass."""
+    return '<div class="' + MAIN_WORD_CLASS + '">\n    ' + content + '\n</div>\n'
+
+
+RECOG_FRONT = DIRECTION_FR_RU + main_word_block(FRENCH_WORD) + EXAMPLE_FRENCH_BLOCK
+
+RECOG_BACK = (
+    RECOG_FRONT
+    + '<hr>\n'
+    + '<div class="translation">' + EMOJI + '{{Russian}}</div>\n'
+    + """{{#ExampleFrench}}
 <div class="example">
-    {{ExampleFrench}}{{#AudioExample}}<span class="audio-btn">{{AudioExample}}</span>{{/AudioExample}}
+    {{#ExampleRussian}}
+    <div class="example-translation">{{ExampleRussian}}</div>
+    {{/ExampleRussian}}
 </div>
 {{/ExampleFrench}}
-{{#Notes}}
-<div class="notes">{{Notes}}</div>
-{{/Notes}}
-<script>
-(function() {
-    var g = '{{WordType}}'.trim().toLowerCase();
-    var mainWord = document.getElementById('main-word');
-    var genderTag = document.getElementById('gender-tag');
-    var validTypes = ['m','f','v','adj','adv','conj','prep','pron','num','interj','expr','loc'];
-    if (validTypes.includes(g)) {
-        mainWord.classList.add('gender-' + g);
-        genderTag.classList.add('gender-' + g);
-    } else {
-        genderTag.classList.add('gender-other');
-    }
-})();
-</script>
 """
+    + NOTES_BLOCK
+)
+
+PROD_FRONT = DIRECTION_RU_FR + RUSSIAN_WORD_BLOCK
+
+PROD_BACK = (
+    PROD_FRONT
+    + '<hr>\n'
+    + main_word_block(EMOJI + FRENCH_WORD)
+    + EXAMPLE_FRENCH_BLOCK
+    + NOTES_BLOCK
+)
 
 CLOZE_TEMPLATE = """
 <div class="verb-header">{{Verb}}</div>
@@ -325,6 +317,7 @@ vocab_model = genanki.Model(
         {'name': 'Emoji'},
         {'name': 'Audio'},
         {'name': 'AudioExample'},
+        {'name': 'GenderClass'},
     ],
     templates=[
         {'name': 'Recognition (FR->RU)', 'qfmt': RECOG_FRONT, 'afmt': RECOG_BACK},
@@ -354,6 +347,8 @@ vocab_deck = genanki.Deck(VOCAB_DECK_ID, 'French::Vocabulary::Core')
 conj_deck = genanki.Deck(CONJ_DECK_ID, 'French::Grammar::Conjugation')
 
 # SAMPLE DATA
+DEMO_TAGS = ['demo']
+
 vocab_samples = [
     ("une maison", "дом", "f",
      "Nous avons acheté <b>une maison</b> dans la banlieue.",
@@ -389,9 +384,10 @@ vocab_samples = [
      "", "", "", ""),
 ]
 
-for card in vocab_samples:
-    note = genanki.Note(model=vocab_model, fields=list(card), tags=['demo'])
-    vocab_deck.add_note(note)
+vocab_deck.notes = [
+    genanki.Note(model=vocab_model, fields=[*card, gender_class(card[2])], tags=DEMO_TAGS)
+    for card in vocab_samples
+]
 
 conj_samples = [
     ("aller", "идти", "Présent",
@@ -408,9 +404,10 @@ conj_samples = [
      "Вспомогательный глагол"),
 ]
 
-for card in conj_samples:
-    note = genanki.Note(model=cloze_model, fields=list(card), tags=['demo'])
-    conj_deck.add_note(note)
+conj_deck.notes = [
+    genanki.Note(model=cloze_model, fields=list(card), tags=DEMO_TAGS)
+    for card in conj_samples
+]
 
 # EXPORT
 package = genanki.Package([vocab_deck, conj_deck])
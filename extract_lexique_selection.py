@@ -7,13 +7,18 @@
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pathlib import Path
 
 # Fix Windows console encoding
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
+from lexique_io import load_raw, top_n
 from scripts.config import FREQ_FILMS_WEIGHT, FREQ_BOOKS_WEIGHT
 
 LEXIQUE_PATH = Path("Lexique383.tsv")
@@ -26,23 +31,55 @@ TOP_N = 10000
 # Порог для отдельного файла
 MIN_CATEGORY_SIZE = 100
 
+# Колонки Lexique383, нужные для выборки
+LEXIQUE_COLS = [
+    'ortho', 'lemme', 'cgram', 'genre', 'nombre', 'infover', 'islem',
+    'freqfilms2', 'freqlivres', 'freqlemfilms2', 'freqlemlivres',
+]
+
 # Выходные колонки
 OUTPUT_COLS = ['lemme', 'cgram', 'genre', 'freqlem', 'forms']
 
+# Категории, формы которых собираются по infover
+VERB_CATEGORIES = ['VER', 'AUX']
+
+
+def collect_all_forms(df: pd.DataFrame) -> dict[tuple[str, str], str]:
+    """
+    Собирает формы всех лемм: глаголы (VER/AUX) — по infover,
+    остальные — по роду и числу. Таблица делится на две части одной маской.
+
+    Returns:
+        dict[(lemme, cgram)] -> строка форм
+    """
+    is_verb = df['cgram'].isin(VERB_CATEGORIES)
+    return {**get_word_forms(df[~is_verb]), **get_verb_forms(df[is_verb])}
+
 
 def get_verb_forms(df: pd.DataFrame) -> dict[tuple[str, str], str]:
     """
     Собирает формы глаголов по infover для каждой леммы.
+    Ожидает только строки VER/AUX (см. collect_all_forms).
+    Пропуски в genre/nombre/infover должны быть заменены на '' (см. main).
 
     Returns:
         dict[(lemme, cgram)] -> "inf, par.passé (par.présent)"
     """
-    verb_forms = {}
-
-    # Фильтруем только глаголы
-    verbs_df = df[df['cgram'].isin(['VER', 'AUX'])].copy()
+    if df.empty:
+        return {}
+
+    # Стабильная сортировка: строки одной (lemme, cgram) идут подряд
+    # в исходном порядке, границы групп — по смене ключа
+    df = df.sort_values(['lemme', 'cgram'], kind='stable')
+    lemmes = df['lemme'].to_numpy()
+    cgrams = df['cgram'].to_numpy()
+    starts = np.flatnonzero(np.r_[True, (lemmes[1:] != lemmes[:-1]) | (cgrams[1:] != cgrams[:-1])])
+    ends = np.r_[starts[1:], len(df)]
+    rows = list(zip(*(df[col].to_numpy() for col in ['ortho', 'infover', 'genre', 'nombre'])))
 
-    for (lemme, cgram), group in verbs_df.groupby(['lemme', 'cgram']):
+    verb_forms = {}
+    for start, end in zip(starts, ends):
+        lemme = lemmes[start]
         forms = {
             'inf': '',
             'par_pas_ms': '',  # причастие прош. м.ед.
@@ -50,12 +87,7 @@ def get_verb_forms(df: pd.DataFrame) -> dict[tuple[str, str], str]:
             'par_pre': '',     # причастие наст.
         }
 
-        for _, row in group.iterrows():
-            infover = row['infover'] if pd.notna(row['infover']) else ''
-            ortho = row['ortho']
-            genre = row['genre'] if pd.notna(row['genre']) else ''
-            nombre = row['nombre'] if pd.notna(row['nombre']) else ''
-
+        for ortho, infover, genre, nombre in rows[start:end]:
             if 'inf' in infover:
                 # Предпочитаем форму, совпадающую с леммой (защита от ошибок в данных)
                 if ortho == lemme or not forms['inf']:
@@ -70,7 +102,7 @@ def get_verb_forms(df: pd.DataFrame) -> dict[tuple[str, str], str]:
                 forms['par_pre'] = ortho
 
         # Формируем строку
-        verb_forms[(lemme, cgram)] = _format_verb_forms(lemme, forms)
+        verb_forms[(lemme, cgrams[start])] = _format_verb_forms(lemme, forms)
 
     return verb_forms
 
@@ -110,7 +142,8 @@ def _format_verb_forms(lemme: str, forms: dict) -> str:
 def get_word_forms(df: pd.DataFrame) -> dict[tuple[str, str], str]:
     """
     Собирает формы слов по роду и числу для каждой леммы+cgram.
-    Для глаголов используйте get_verb_forms().
+    Ожидает строки без VER/AUX (см. collect_all_forms).
+    Пропуски в genre/nombre и частотностях должны быть заполнены (см. main).
 
     При наличии нескольких форм в одной группе (genre, nombre) выбирается
     форма с наибольшей частотностью (например, yeux вместо oeils).
@@ -118,57 +151,54 @@ def get_word_forms(df: pd.DataFrame) -> dict[tuple[str, str], str]:
     Returns:
         dict[(lemme, cgram)] -> "форма1/форма2 форма3/форма4"
     """
-    forms_dict = {}
+    keys = ['lemme', 'cgram', 'genre', 'nombre']
+
+    non_verbs = pd.DataFrame({
+        'lemme': df['lemme'],
+        'cgram': df['cgram'],
+        'genre': df['genre'],
+        'nombre': df['nombre'],
+        'ortho': df['ortho'],
+        # Частотность формы (не леммы)
+        'freq': df['freqfilms2'] + df['freqlivres'],
+    })
+
+    # Одна строка на форму в группе (genre, nombre) с максимальной частотностью
+    forms = non_verbs.groupby(keys + ['ortho'], sort=False, observed=True)['freq'].max().reset_index()
+
+    # Группы без числа ('m', ''), ('f', ''), ('', '') — сохраняем все формы
+    # Это могут быть ед./мн. формы (cinquième/cinquièmes) или invariable
+    no_number = forms['nombre'] == ''
+
+    # Остальные группы: формы с частотностью ≥ 90% от максимальной
+    max_freq = forms.groupby(keys, sort=False, observed=True)['freq'].transform('max')
+    top = forms[~no_number & (forms['freq'] >= max_freq * 0.9)]
+
+    # При равной частотности — предпочитаем длинную форму (glaciaux > glacials)
+    # При равной длине — предпочитаем нерегулярную форму (не на -s)
+    # Ключ считается векторно один раз, победитель группы — первый максимум
+    # (idxmax), без сортировки всех кандидатов
+    score = top['ortho'].str.len().to_numpy() * 2 + ~top['ortho'].str.endswith('s').to_numpy()
+    best_idx = top.assign(score=score).groupby(keys, sort=False, observed=True)['score'].idxmax()
+    best = top.loc[best_idx]
+    # Сортируем один раз: формы одной (lemme, cgram) идут подряд,
+    # границы групп находим по смене ключа между соседними строками
+    selected = pd.concat([forms[no_number], best]).sort_values(['lemme', 'cgram'], kind='stable')
+    if selected.empty:
+        return {}
+    lemmes = selected['lemme'].to_numpy()
+    cgrams = selected['cgram'].to_numpy()
+    starts = np.flatnonzero(np.r_[True, (lemmes[1:] != lemmes[:-1]) | (cgrams[1:] != cgrams[:-1])])
+    ends = np.r_[starts[1:], len(selected)]
+    rows = list(zip(*(selected[col].to_numpy() for col in ['genre', 'nombre', 'ortho'])))
 
-    # Группируем по лемме и грамматической категории (исключаем глаголы)
-    non_verbs = df[~df['cgram'].isin(['VER', 'AUX'])]
-
-    for (lemme, cgram), group in non_verbs.groupby(['lemme', 'cgram']):
-        # Собираем формы по роду и числу с частотностью
-        # (genre, nombre) -> {ortho: freq}
+    forms_dict = {}
+    for start, end in zip(starts, ends):
+        # (genre, nombre) -> [ortho, ...]: одна форма, кроме групп без числа
         forms_by_gn = {}
-
-        for _, row in group.iterrows():
-            genre = row['genre'] if pd.notna(row['genre']) else ''
-            nombre = row['nombre'] if pd.notna(row['nombre']) else ''
-            ortho = row['ortho']
-            # Частотность формы (не леммы)
-            freq = (row['freqfilms2'] if pd.notna(row['freqfilms2']) else 0) + \
-                   (row['freqlivres'] if pd.notna(row['freqlivres']) else 0)
-
-            key = (genre, nombre)
-            if key not in forms_by_gn:
-                forms_by_gn[key] = {}
-            # Сохраняем форму с максимальной частотностью
-            if ortho not in forms_by_gn[key] or freq > forms_by_gn[key][ortho]:
-                forms_by_gn[key][ortho] = freq
-
-        # Конвертируем в set, выбирая самую частую форму для каждой группы
-        forms_by_gn_sets = {}
-        for key, ortho_freq in forms_by_gn.items():
-            genre, nombre = key
-            if len(ortho_freq) == 1:
-                forms_by_gn_sets[key] = set(ortho_freq.keys())
-            elif nombre == '':
-                # Группы без числа ('m', ''), ('f', ''), ('', '') — сохраняем все формы
-                # Это могут быть ед./мн. формы (cinquième/cinquièmes) или invariable
-                forms_by_gn_sets[key] = set(ortho_freq.keys())
-            else:
-                # Выбираем форму с максимальной частотностью
-                # При равной частотности — предпочитаем более длинную (нерегулярную)
-                max_freq = max(ortho_freq.values())
-                top_forms = [o for o, f in ortho_freq.items() if f >= max_freq * 0.9]
-                if len(top_forms) == 1:
-                    forms_by_gn_sets[key] = {top_forms[0]}
-                else:
-                    # При равной частотности — предпочитаем длинную форму (glaciaux > glacials)
-                    # При равной длине — предпочитаем нерегулярную форму (не на -s)
-                    best_ortho = max(top_forms, key=lambda x: (len(x), not x.endswith('s')))
-                    forms_by_gn_sets[key] = {best_ortho}
-
-        # Формируем строку форм
-        forms_str = _format_forms(lemme, forms_by_gn_sets)
-        forms_dict[(lemme, cgram)] = forms_str
+        for genre, nombre, ortho in rows[start:end]:
+            forms_by_gn.setdefault((genre, nombre), []).append(ortho)
+        forms_dict[(lemmes[start], cgrams[start])] = _format_forms(lemmes[start], forms_by_gn)
 
     return forms_dict
 
@@ -186,7 +216,7 @@ def _format_forms(lemme: str, forms_by_gn: dict) -> str:
     # Специальный случай 1: группа без числа с несколькими формами
     # Например: cinquième/cinquièmes в ('m', ''), deuxième/deuxièmes в ('', '')
     for key in [('m', ''), ('f', ''), ('', '')]:
-        forms = forms_by_gn.get(key, set())
+        forms = forms_by_gn.get(key, ())
         if len(forms) > 1 and len(forms_by_gn) == 1:
             # Сортируем по длине (ед.ч. обычно короче мн.ч.)
             sorted_forms = sorted(forms, key=len)
@@ -194,25 +224,25 @@ def _format_forms(lemme: str, forms_by_gn: dict) -> str:
 
     # Специальный случай 2: ('', '') + ('', 'p') — ед.ч. без числа + мн.ч.
     # Например: livre/livres, mort/morts
-    empty_no_number = forms_by_gn.get(('', ''), set())
-    empty_p = forms_by_gn.get(('', 'p'), set())
+    empty_no_number = forms_by_gn.get(('', ''), ())
+    empty_p = forms_by_gn.get(('', 'p'), ())
     if empty_no_number and empty_p and len(forms_by_gn) == 2:
-        sg = next(iter(empty_no_number))
-        pl = next(iter(empty_p))
+        sg = empty_no_number[0]
+        pl = empty_p[0]
         return f'{sg}, {pl}'
 
     # Специальный случай 3: только ('', 's') и ('', 'p') — invariable с ед./мн.
     # Например: fin/fins, где genre пустой но nombre указан
-    empty_s = forms_by_gn.get(('', 's'), set())
+    empty_s = forms_by_gn.get(('', 's'), ())
     if empty_s and empty_p and len(forms_by_gn) == 2:
-        sg = next(iter(empty_s))
-        pl = next(iter(empty_p))
+        sg = empty_s[0]
+        pl = empty_p[0]
         return f'{sg}, {pl}'
 
     # Извлекаем формы по позициям
-    empty_s = forms_by_gn.get(('', 's'), set())
-    empty_p = forms_by_gn.get(('', 'p'), set())
-    empty_no_num = forms_by_gn.get(('', ''), set())
+    empty_s = forms_by_gn.get(('', 's'), ())
+    empty_p = forms_by_gn.get(('', 'p'), ())
+    empty_no_num = forms_by_gn.get(('', ''), ())
 
     has_m_s = ('m', 's') in forms_by_gn
     has_f_s = ('f', 's') in forms_by_gn
@@ -223,8 +253,8 @@ def _format_forms(lemme: str, forms_by_gn: dict) -> str:
     # - ('f', 's') → fs
     # - ('', 's') → ms если есть ('f', 's'), иначе и ms и fs (invariable)
     # - ('', '') → ms/fs fallback если нет других
-    ms = forms_by_gn.get(('m', 's'), set())
-    fs = forms_by_gn.get(('f', 's'), set())
+    ms = forms_by_gn.get(('m', 's'), ())
+    fs = forms_by_gn.get(('f', 's'), ())
 
     # ('', 's') используется как ms когда есть отдельная женская форма
     if not ms and has_empty_s:
@@ -236,7 +266,7 @@ def _format_forms(lemme: str, forms_by_gn: dict) -> str:
             ms = empty_s
 
     # ('m', '') как мужское (vieux, héros — без числа, одна форма для ед. и мн.)
-    m_no_num = forms_by_gn.get(('m', ''), set())
+    m_no_num = forms_by_gn.get(('m', ''), ())
     if not ms and m_no_num:
         ms = m_no_num
 
@@ -246,8 +276,8 @@ def _format_forms(lemme: str, forms_by_gn: dict) -> str:
         ms = empty_no_num
 
     # Множественное число:
-    mp = forms_by_gn.get(('m', 'p'), set())
-    fp = forms_by_gn.get(('f', 'p'), set())
+    mp = forms_by_gn.get(('m', 'p'), ())
+    fp = forms_by_gn.get(('f', 'p'), ())
 
     # Fallback для множественного:
     # 1. ('m', '') без числа = ед. и мн. одинаковые (vieux, héros)
@@ -268,23 +298,20 @@ def _format_forms(lemme: str, forms_by_gn: dict) -> str:
         elif mp and not ms:
             fp = mp
 
-    # Получаем первую форму из каждого множества
-    def first(s):
-        return next(iter(s)) if s else ''
-
-    ms_form = first(ms)
-    fs_form = first(fs)
-    mp_form = first(mp)
-    fp_form = first(fp)
+    # Берём первую форму каждой позиции
+    ms_form = ms[0] if ms else ''
+    fs_form = fs[0] if fs else ''
+    mp_form = mp[0] if mp else ''
+    fp_form = fp[0] if fp else ''
 
-    # Собираем уникальные формы
-    all_forms = {f for f in [ms_form, fs_form, mp_form, fp_form] if f}
+    # Собираем уникальные формы (в порядке м.ед, ж.ед, м.мн, ж.мн)
+    all_forms = list(dict.fromkeys(f for f in [ms_form, fs_form, mp_form, fp_form] if f))
 
     if len(all_forms) == 0:
         return lemme
 
     if len(all_forms) == 1:
-        return first(all_forms)
+        return all_forms[0]
 
     # Есть различия по роду?
     has_gender_diff = fs_form and ms_form and fs_form != ms_form
@@ -309,76 +336,89 @@ def _format_forms(lemme: str, forms_by_gn: dict) -> str:
         return f"{sg}, {pl}"
     else:
         # Одна форма
-        return first(all_forms)
+        return all_forms[0]
 
 
-def main():
-    if not LEXIQUE_PATH.exists():
-        print(f"❌ Файл {LEXIQUE_PATH} не найден!")
-        print("   Скачай с: http://www.lexique.org/databases/Lexique383/Lexique383.tsv")
-        return
+def _write_csv(task: tuple[Path, pd.DataFrame]) -> None:
+    """Сохраняет одну категорию в CSV (задача для пула потоков)."""
+    filepath, data = task
+    pacsv.write_csv(pa.Table.from_pandas(data, preserve_index=False), filepath)
+
+
+def main(raw: pd.DataFrame | None = None):
+    # Загрузка (если таблица не передана вызывающим кодом)
+    if raw is None:
+        if not LEXIQUE_PATH.exists():
+            print(f"❌ Файл {LEXIQUE_PATH} не найден!")
+            print("   Скачай с: http://www.lexique.org/databases/Lexique383/Lexique383.tsv")
+            return
+        # Из Parquet читаем только нужные колонки
+        raw = load_raw(LEXIQUE_PATH, tuple(LEXIQUE_COLS))
+    df = raw[LEXIQUE_COLS]
 
     # Создаём папку для выходных файлов
     OUTPUT_DIR.mkdir(exist_ok=True)
 
-    # Загрузка
-    df = pd.read_csv(LEXIQUE_PATH, sep='\t', low_memory=False)
     print(f"✅ Загружено {len(df):,} записей из Lexique383")
 
-    # Собираем формы слов (до фильтрации по islem)
-    print("📝 Собираем формы слов...")
-    word_forms = get_word_forms(df)
-    print(f"   Собрано форм для {len(word_forms):,} не-глаголов")
-
-    print("📝 Собираем формы глаголов...")
-    verb_forms = get_verb_forms(df)
-    print(f"   Собрано форм для {len(verb_forms):,} глаголов")
+    # Пропуски заполняем один раз: род/число/infover → '', частотности форм → 0
+    # (для род/число пустая строка добавляется в категории)
+    df = df.assign(
+        genre=df['genre'].cat.add_categories('').fillna(''),
+        nombre=df['nombre'].cat.add_categories('').fillna(''),
+        infover=df['infover'].fillna(''),
+        freqfilms2=df['freqfilms2'].fillna(0),
+        freqlivres=df['freqlivres'].fillna(0),
+    )
 
-    # Объединяем словари
-    forms_dict = {**word_forms, **verb_forms}
+    # Собираем формы слов (до фильтрации по islem)
+    print("📝 Собираем формы слов и глаголов...")
+    forms_dict = collect_all_forms(df)
+    print(f"   Собрано форм для {len(forms_dict):,} лемм")
 
     # 1. Только леммы
-    lemmas = df[df['islem'] == 1].copy()
+    lemmas = df[df['islem'] == 1]
     print(f"📋 Лемм (islem=1): {len(lemmas):,}")
 
     # 2. Вычисляем freqlem (взвешенная формула из config.py)
-    lemmas['freqlem'] = (
+    freqlem = (
         FREQ_FILMS_WEIGHT * lemmas['freqlemfilms2'].fillna(0) +
         FREQ_BOOKS_WEIGHT * lemmas['freqlemlivres'].fillna(0)
     )
 
-    # 3. Добавляем формы
-    lemmas['forms'] = lemmas.apply(
-        lambda row: forms_dict.get((row['lemme'], row['cgram']), row['lemme']),
-        axis=1
+    # 3. Добавляем формы (если форм нет — сама лемма)
+    keys = pd.MultiIndex.from_arrays([lemmas['lemme'], lemmas['cgram']])
+    forms = pd.Series(forms_dict).reindex(keys).to_numpy()
+    lemmas = lemmas.assign(
+        freqlem=freqlem,
+        forms=np.where(pd.isna(forms), lemmas['lemme'].to_numpy(), forms),
     )
 
-    # 4. Разделяем на две группы
-    freq_filtered = lemmas[lemmas['cgram'].isin(FREQ_FILTERED_CATEGORIES)].copy()
-    other = lemmas[~lemmas['cgram'].isin(FREQ_FILTERED_CATEGORIES)].copy()
+    # 4. Разделяем на две группы (сразу оставляем нужные колонки)
+    is_freq_filtered = lemmas['cgram'].isin(FREQ_FILTERED_CATEGORIES)
+    other = lemmas.loc[~is_freq_filtered, OUTPUT_COLS]
 
     print(f"\n📊 Категории с фильтром ({', '.join(FREQ_FILTERED_CATEGORIES)}):")
-    print(f"   Всего: {len(freq_filtered):,}")
+    print(f"   Всего: {is_freq_filtered.sum():,}")
 
     # 5. Для VER/NOM/ADJ/ADV: топ-10000 по freqlem
-    freq_filtered = freq_filtered.nlargest(TOP_N, 'freqlem')
+    freq_filtered = top_n(lemmas.loc[is_freq_filtered, OUTPUT_COLS], TOP_N, 'freqlem')
     print(f"✂️  После фильтра топ-{TOP_N:,}: {len(freq_filtered):,}")
 
     # Статистика по категориям в топе
     print(f"\n📈 Распределение в топ-{TOP_N:,}:")
+    top_counts = freq_filtered['cgram'].value_counts()
     for cat in FREQ_FILTERED_CATEGORIES:
-        count = len(freq_filtered[freq_filtered['cgram'] == cat])
-        print(f"   {cat:<6} {count:>6}")
+        print(f"   {cat:<6} {top_counts.get(cat, 0):>6}")
 
-    # 6. Объединяем (исключаем записи без категории)
+    # 6. Объединяем (исключаем записи без категории): обе части — строки lemmas,
+    # собираем их одним .loc по индексам
     other = other[other['cgram'].notna()]
-    result = pd.concat([freq_filtered, other], ignore_index=True)
+    result = lemmas.loc[np.concatenate([freq_filtered.index, other.index]), OUTPUT_COLS]
 
-    # 7. Оставляем нужные колонки
-    result = result[OUTPUT_COLS].copy()
-
-    # 8. Разделяем по категориям
+    # 7. Разделяем по категориям
     category_counts = result['cgram'].value_counts()
+    category_counts = category_counts[category_counts > 0]
 
     large_categories = category_counts[category_counts >= MIN_CATEGORY_SIZE].index.tolist()
     small_categories = category_counts[category_counts < MIN_CATEGORY_SIZE].index.tolist()
@@ -391,29 +431,33 @@ def main():
     for cat in sorted(small_categories):
         print(f"   {cat:<12} {category_counts[cat]:>6}")
 
-    # 9. Сохраняем файлы
-    total_saved = 0
+    # 8. Сохраняем файлы (один проход по result, отсортированному по категории)
+    large_set = set(large_categories)
+    other_parts = []
+    tasks = []
 
-    for cat in large_categories:
-        cat_data = result[result['cgram'] == cat].copy()
-        cat_data = cat_data.sort_values('freqlem', ascending=False)
+    result_sorted = result.sort_values(['cgram', 'freqlem'], ascending=[True, False])
+    for cat, cat_data in result_sorted.groupby('cgram', sort=False, observed=True):
+        if cat not in large_set:
+            other_parts.append(cat_data)
+            continue
 
         # Имя файла: заменяем : на _
         filename = cat.replace(':', '_') + '.csv'
-        filepath = OUTPUT_DIR / filename
-        cat_data.to_csv(filepath, index=False)
+        tasks.append((OUTPUT_DIR / filename, cat_data))
 
-        print(f"   💾 {filename}: {len(cat_data):,} лемм")
-        total_saved += len(cat_data)
+    # other.csv (малые категории уже отсортированы по cgram, freqlem)
+    other_data = pd.concat(other_parts) if other_parts else result_sorted.iloc[:0]
+    tasks.append((OUTPUT_DIR / 'other.csv', other_data))
 
-    # Сохраняем other.csv
-    other_data = result[result['cgram'].isin(small_categories)].copy()
-    other_data = other_data.sort_values(['cgram', 'freqlem'], ascending=[True, False])
-    other_path = OUTPUT_DIR / 'other.csv'
-    other_data.to_csv(other_path, index=False)
+    # Файлы независимы — пишем параллельно
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(_write_csv, tasks))
 
-    print(f"   💾 other.csv: {len(other_data):,} лемм")
-    total_saved += len(other_data)
+    total_saved = 0
+    for filepath, data in tasks:
+        print(f"   💾 {filepath.name}: {len(data):,} лемм")
+        total_saved += len(data)
 
     print(f"\n" + "=" * 60)
     print(f"✅ ИТОГО: {total_saved:,} лемм")
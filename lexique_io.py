@@ -0,0 +1,109 @@
+"""
+Load Lexique383 with a Parquet cache.
+
+The TSV is parsed once and saved next to it as Lexique383.parquet.
+Later runs read the typed columns from Parquet while the cache is
+newer than the TSV. The scripts/ pipeline reads its columns from the
+same cache. Within one process the loaded tables are memoized, so
+several analyses can share a single load:
+
+Usage:
+    python -m lexique_io all
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from functools import lru_cache
+from pathlib import Path
+
+LEXIQUE_PATH = Path("Lexique383.tsv")
+
+# Explicit types for the parsed columns (the rest keep the defaults:
+# pandas 'str' for text with NaN for missing values, float64/int64)
+LEXIQUE_DTYPES = {
+    'cgram': 'category',
+    'genre': 'category',
+    'nombre': 'category',
+    'islem': 'int8',
+}
+
+
+@lru_cache(maxsize=None)
+def load_raw(path: Path = LEXIQUE_PATH, columns: tuple[str, ...] | None = None) -> pd.DataFrame:
+    """Load all Lexique383 rows, refreshing the Parquet cache if the TSV is newer.
+
+    With columns, only those are read from Parquet (the cache keeps them all);
+    columns missing from the TSV are skipped.
+    The result is shared between callers: filter or assign, never modify in place.
+    """
+    cache_path = path.with_suffix('.parquet')
+    # The cache is also stale when it predates this file (LEXIQUE_DTYPES)
+    if (
+        not cache_path.exists()
+        or cache_path.stat().st_mtime < path.stat().st_mtime
+        or cache_path.stat().st_mtime < Path(__file__).stat().st_mtime
+    ):
+        df = pd.read_csv(
+            path,
+            sep='\t',
+            dtype=LEXIQUE_DTYPES,
+            engine='pyarrow',
+        )
+        df.to_parquet(cache_path, compression='snappy')
+    if columns:
+        available = pq.read_schema(cache_path).names
+        columns = [col for col in columns if col in available]
+    return pd.read_parquet(cache_path, columns=columns)
+
+
+@lru_cache(maxsize=None)
+def load_lemmas(path: Path = LEXIQUE_PATH) -> pd.DataFrame:
+    """Load lemma rows (islem == 1), dropping categories seen only in other rows."""
+    raw = load_raw(path)
+    lemmas = raw[raw['islem'] == 1]
+    return lemmas.assign(cgram=lemmas['cgram'].cat.remove_unused_categories())
+
+
+def top_n(df: pd.DataFrame, n: int, column: str) -> pd.DataFrame:
+    """Return the n rows with the largest column values, in original order.
+
+    Same rows as dropna().nlargest(n, column): NaN is never selected and ties
+    at the cut-off keep the earliest rows. The cut-off comes from np.partition
+    (O(N), no full sort).
+    """
+    values = df[column].to_numpy(dtype='float64', na_value=np.nan)
+    # np.partition sorts NaN as the largest value: partition the others only
+    is_number = ~np.isnan(values)
+    count = int(is_number.sum())
+    if count <= n:
+        return df if count == len(values) else df[is_number]
+    if n <= 0:
+        return df.iloc[:0]
+    threshold = np.partition(values[is_number], count - n)[count - n]
+    mask = values > threshold
+    ties = np.flatnonzero(values == threshold)
+    mask[ties[:n - mask.sum()]] = True
+    return df[mask]
+
+
+def main():
+    """Run count_lemma_types and extract_lexique_selection on one load."""
+    import count_lemma_types
+    import extract_lexique_selection
+
+    if not LEXIQUE_PATH.exists() and not count_lemma_types.download_lexique():
+        return 1
+
+    count_lemma_types.main(load_lemmas())
+    print()
+    extract_lexique_selection.main(load_raw())
+    return 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ['all']:
+        print(__doc__)
+        sys.exit(2)
+    sys.exit(main())
@@ -8,6 +8,9 @@ Extracts lemmas from Lexique383 database:
 - Splits into separate files: categories >= MIN_CATEGORY_SIZE get own file, rest go to other.csv
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 from config import (
     LEXIQUE_PATH,
@@ -19,7 +22,11 @@ from config import (
     FREQ_FILMS_WEIGHT,
     FREQ_BOOKS_WEIGHT,
     REQUIRED_LEXIQUE_COLUMNS,
+    LEXIQUE_COLUMNS,
+    load_lemmas_with_freq,
 )
+from lexique_io import load_raw, top_n
+from utils import write_csv
 
 
 def get_word_forms(df: pd.DataFrame) -> dict[tuple[str, str], str]:
@@ -29,23 +36,42 @@ def get_word_forms(df: pd.DataFrame) -> dict[tuple[str, str], str]:
     Returns:
         dict[(lemme, cgram)] -> "form1/form2 form3/form4"
     """
-    forms_dict = {}
+    # Replace missing gender/number once, rows without lemma/cgram are skipped
+    df = df.dropna(subset=['lemme', 'cgram'])
+    if df.empty:
+        return {}
+    df = df.assign(
+        genre=df['genre'].cat.add_categories('').fillna(''),
+        nombre=df['nombre'].cat.add_categories('').fillna(''),
+    )
 
-    for (lemme, cgram), group in df.groupby(['lemme', 'cgram']):
-        forms_by_gn = {}  # (genre, nombre) -> set(ortho)
+    # Factorize the key columns and ortho to integer codes, then keep the first
+    # row of each distinct (lemme, cgram, genre, nombre, ortho): one np.unique
+    # over the code matrix instead of a Python set per (genre, nombre) slot
+    codes = np.column_stack([
+        pd.factorize(df[col])[0] for col in ['lemme', 'cgram', 'genre', 'nombre', 'ortho']
+    ])
+    _, first_rows = np.unique(codes, axis=0, return_index=True)
+    first_rows.sort()  # back to original row order
+
+    # Sort once (stable), so each (lemme, cgram) is a contiguous run of rows
+    lemme_codes, cgram_codes = codes[first_rows, 0], codes[first_rows, 1]
+    order = first_rows[np.lexsort((cgram_codes, lemme_codes))]
+    lemmes, cgrams, genres, nombres, orthos = (
+        df[col].to_numpy()[order] for col in ['lemme', 'cgram', 'genre', 'nombre', 'ortho']
+    )
 
-        for _, row in group.iterrows():
-            genre = row['genre'] if pd.notna(row['genre']) else ''
-            nombre = row['nombre'] if pd.notna(row['nombre']) else ''
-            ortho = row['ortho']
+    changed = (np.diff(codes[order, 0]) != 0) | (np.diff(codes[order, 1]) != 0)
+    starts = np.flatnonzero(np.r_[True, changed])
+    ends = np.r_[starts[1:], len(order)]
 
-            key = (genre, nombre)
-            if key not in forms_by_gn:
-                forms_by_gn[key] = set()
-            forms_by_gn[key].add(ortho)
+    forms_dict = {}
+    for start, end in zip(starts, ends):
+        forms_by_gn = {}  # (genre, nombre) -> [ortho, ...] (unique, in file order)
+        for genre, nombre, ortho in zip(genres[start:end], nombres[start:end], orthos[start:end]):
+            forms_by_gn.setdefault((genre, nombre), []).append(ortho)
 
-        forms_str = _format_forms(lemme, forms_by_gn)
-        forms_dict[(lemme, cgram)] = forms_str
+        forms_dict[(lemmes[start], cgrams[start])] = _format_forms(lemmes[start], forms_by_gn)
 
     return forms_dict
 
@@ -59,25 +85,25 @@ def _format_forms(lemme: str, forms_by_gn: dict) -> str:
     - Two forms (sg/pl): sg, pl
     - Four forms (m/f x sg/pl): m.sg/f.sg m.pl/f.pl
     """
-    ms = forms_by_gn.get(('m', 's'), forms_by_gn.get(('', 's'), set()))
-    fs = forms_by_gn.get(('f', 's'), set())
-    mp = forms_by_gn.get(('m', 'p'), forms_by_gn.get(('', 'p'), set()))
-    fp = forms_by_gn.get(('f', 'p'), set())
+    ms = forms_by_gn.get(('m', 's'), forms_by_gn.get(('', 's'), ()))
+    fs = forms_by_gn.get(('f', 's'), ())
+    mp = forms_by_gn.get(('m', 'p'), forms_by_gn.get(('', 'p'), ()))
+    fp = forms_by_gn.get(('f', 'p'), ())
 
     if not ms and not mp:
-        ms = forms_by_gn.get(('m', ''), forms_by_gn.get(('', ''), set()))
+        ms = forms_by_gn.get(('m', ''), forms_by_gn.get(('', ''), ()))
     if not fs and not fp:
-        fs = forms_by_gn.get(('f', ''), set())
+        fs = forms_by_gn.get(('f', ''), ())
 
     def first(s):
-        return next(iter(s)) if s else ''
+        return s[0] if s else ''
 
     ms_form = first(ms)
     fs_form = first(fs)
     mp_form = first(mp)
     fp_form = first(fp)
 
-    all_forms = {f for f in [ms_form, fs_form, mp_form, fp_form] if f}
+    all_forms = list(dict.fromkeys(f for f in [ms_form, fs_form, mp_form, fp_form] if f))
 
     if len(all_forms) == 0:
         return lemme
@@ -105,16 +131,6 @@ def _format_forms(lemme: str, forms_by_gn: dict) -> str:
         return first(all_forms)
 
 
-def calculate_weighted_frequency(df: pd.DataFrame) -> pd.Series:
-    """
-    Calculates weighted frequency for TEF/TCF preparation.
-    Films weighted higher for oral comprehension.
-    """
-    films = df['freqlemfilms2'].fillna(0)
-    books = df['freqlemlivres'].fillna(0)
-    return FREQ_FILMS_WEIGHT * films + FREQ_BOOKS_WEIGHT * books
-
-
 def main():
     if not LEXIQUE_PATH.exists():
         print(f"File {LEXIQUE_PATH} not found!")
@@ -123,60 +139,57 @@ def main():
 
     CATEGORIES_DIR.mkdir(exist_ok=True)
 
-    # Load
-    df = pd.read_csv(LEXIQUE_PATH, sep='\t', low_memory=False)
-    print(f"Loaded {len(df):,} records from Lexique383")
-
-    # Validate columns
-    missing = set(REQUIRED_LEXIQUE_COLUMNS) - set(df.columns)
+    # Validate columns (header only)
+    header = pd.read_csv(LEXIQUE_PATH, sep='\t', nrows=0).columns
+    missing = set(REQUIRED_LEXIQUE_COLUMNS) - set(header)
     if missing:
         print(f"Missing required columns: {missing}")
         return 1
 
+    # Load (Parquet cache of the needed columns, see lexique_io.load_raw)
+    df = load_raw(LEXIQUE_PATH, LEXIQUE_COLUMNS)
+    print(f"Loaded {len(df):,} records from Lexique383")
+
     # Collect word forms (before filtering by islem)
     print("Collecting word forms...")
     forms_dict = get_word_forms(df)
     print(f"   Collected forms for {len(forms_dict):,} lemmas")
 
-    # 1. Lemmas only
-    lemmas = df[df['islem'] == 1].copy()
+    # 1-2. Lemmas only, with weighted frequency (shared loader, see config)
+    lemmas = load_lemmas_with_freq()
     print(f"Lemmas (islem=1): {len(lemmas):,}")
 
-    # 2. Calculate weighted frequency
-    lemmas['freqlem'] = calculate_weighted_frequency(lemmas)
-
-    # 3. Add forms
-    lemmas['forms'] = lemmas.apply(
-        lambda row: forms_dict.get((row['lemme'], row['cgram']), row['lemme']),
-        axis=1
-    )
+    # 3. Add forms (lemma itself when no forms were collected)
+    keys = pd.MultiIndex.from_arrays([lemmas['lemme'], lemmas['cgram']])
+    forms = pd.Series(forms_dict).reindex(keys).to_numpy()
+    lemmas = lemmas.assign(forms=np.where(pd.isna(forms), lemmas['lemme'].to_numpy(), forms))
 
     # 4. Split into two groups
-    freq_filtered = lemmas[lemmas['cgram'].isin(FREQ_FILTERED_CATEGORIES)].copy()
-    other = lemmas[~lemmas['cgram'].isin(FREQ_FILTERED_CATEGORIES)].copy()
+    is_freq_filtered = lemmas['cgram'].isin(FREQ_FILTERED_CATEGORIES)
+    freq_filtered = lemmas[is_freq_filtered]
+    other = lemmas[~is_freq_filtered]
 
     print(f"\nCategories with filter ({', '.join(FREQ_FILTERED_CATEGORIES)}):")
     print(f"   Total: {len(freq_filtered):,}")
 
     # 5. For VER/NOM/ADJ/ADV: top N by freqlem
-    freq_filtered = freq_filtered.nlargest(TOP_N_PER_CATEGORY, 'freqlem')
+    freq_filtered = top_n(freq_filtered, TOP_N_PER_CATEGORY, 'freqlem')
     print(f"After top-{TOP_N_PER_CATEGORY:,} filter: {len(freq_filtered):,}")
 
     # Category distribution in top N
     print(f"\nDistribution in top-{TOP_N_PER_CATEGORY:,}:")
+    top_counts = freq_filtered['cgram'].value_counts()
     for cat in FREQ_FILTERED_CATEGORIES:
-        count = len(freq_filtered[freq_filtered['cgram'] == cat])
-        print(f"   {cat:<6} {count:>6}")
+        print(f"   {cat:<6} {top_counts.get(cat, 0):>6}")
 
-    # 6. Merge (exclude records without category)
+    # 6-7. Merge (exclude records without category), keeping only needed columns.
+    # Both parts are row subsets of lemmas: gather them in one .loc
     other = other[other['cgram'].notna()]
-    result = pd.concat([freq_filtered, other], ignore_index=True)
-
-    # 7. Keep only needed columns
-    result = result[CATEGORY_COLUMNS].copy()
+    result = lemmas.loc[np.concatenate([freq_filtered.index, other.index]), CATEGORY_COLUMNS]
 
     # 8. Split by categories
     category_counts = result['cgram'].value_counts()
+    category_counts = category_counts[category_counts > 0]  # unused categories
 
     large_categories = category_counts[category_counts >= MIN_CATEGORY_SIZE].index.tolist()
     small_categories = category_counts[category_counts < MIN_CATEGORY_SIZE].index.tolist()
@@ -189,28 +202,28 @@ def main():
     for cat in sorted(small_categories):
         print(f"   {cat:<12} {category_counts[cat]:>6}")
 
-    # 9. Save files
-    total_saved = 0
+    # 9. Save files (one groupby pass instead of a mask per category)
+    grouped = dict(tuple(result.groupby('cgram', sort=False, observed=True)))
+    tasks = []  # (filepath, data)
 
     for cat in large_categories:
-        cat_data = result[result['cgram'] == cat].copy()
-        cat_data = cat_data.sort_values('freqlem', ascending=False)
-
+        cat_data = grouped[cat].sort_values('freqlem', ascending=False, kind='stable')
         filename = cat.replace(':', '_') + '.csv'
-        filepath = CATEGORIES_DIR / filename
-        cat_data.to_csv(filepath, index=False)
-
-        print(f"   {filename}: {len(cat_data):,} lemmas")
-        total_saved += len(cat_data)
+        tasks.append((CATEGORIES_DIR / filename, cat_data))
 
-    # Save other.csv
-    other_data = result[result['cgram'].isin(small_categories)].copy()
+    # other.csv
+    other_data = pd.concat([grouped[cat] for cat in small_categories]) if small_categories else result.iloc[:0]
     other_data = other_data.sort_values(['cgram', 'freqlem'], ascending=[True, False])
-    other_path = CATEGORIES_DIR / 'other.csv'
-    other_data.to_csv(other_path, index=False)
+    tasks.append((CATEGORIES_DIR / 'other.csv', other_data))
 
-    print(f"   other.csv: {len(other_data):,} lemmas")
-    total_saved += len(other_data)
+    # Files are independent: write them in parallel (pyarrow releases the GIL)
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(write_csv, [data for _, data in tasks], [path for path, _ in tasks]))
+
+    total_saved = 0
+    for filepath, data in tasks:
+        print(f"   {filepath.name}: {len(data):,} lemmas")
+        total_saved += len(data)
 
     print(f"\n" + "=" * 60)
     print(f"TOTAL: {total_saved:,} lemmas")
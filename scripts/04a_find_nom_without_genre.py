@@ -12,15 +12,15 @@ These require manual review to classify as:
 Output: data/nom_without_genre.csv (only words above FREQ_MIN_THRESHOLD)
 """
 
+import numpy as np
 import pandas as pd
 from config import (
     LEXIQUE_PATH,
     DATA_DIR,
     NOM_WITHOUT_GENRE_PATH,
     GENDER_HOMOGRAPHS_PATH,
-    FREQ_FILMS_WEIGHT,
-    FREQ_BOOKS_WEIGHT,
     FREQ_MIN_THRESHOLD,
+    load_lemmas_with_freq,
 )
 
 
@@ -31,22 +31,15 @@ def main():
 
     DATA_DIR.mkdir(exist_ok=True)
 
-    # Load Lexique
-    df = pd.read_csv(LEXIQUE_PATH, sep='\t', low_memory=False, encoding='utf-8')
-    lemmas = df[df['islem'] == 1].copy()
+    # Load Lexique lemmas with weighted frequency (shared loader, see config)
+    lemmas = load_lemmas_with_freq()
 
-    # Filter NOM with genre=NaN
-    nom = lemmas[(lemmas['cgram'] == 'NOM') & (lemmas['genre'].isna())].copy()
-
-    # Calculate weighted frequency
-    nom['freqlem'] = (
-        FREQ_FILMS_WEIGHT * nom['freqlemfilms2'].fillna(0) +
-        FREQ_BOOKS_WEIGHT * nom['freqlemlivres'].fillna(0)
-    )
-
-    # Filter by threshold
-    nom = nom[nom['freqlem'] >= FREQ_MIN_THRESHOLD].copy()
-    nom = nom.sort_values('freqlem', ascending=False)
+    # NOM with genre=NaN above threshold (one combined mask)
+    nom = lemmas[
+        (lemmas['cgram'] == 'NOM')
+        & lemmas['genre'].isna()
+        & (lemmas['freqlem'] >= FREQ_MIN_THRESHOLD)
+    ].sort_values('freqlem', ascending=False)
 
     print(f"NOM without genre above threshold ({FREQ_MIN_THRESHOLD}): {len(nom)}")
 
@@ -57,16 +50,11 @@ def main():
         known_homographs = set(gh['lemme'].unique())
         print(f"Loaded {len(known_homographs)} known gender homographs")
 
-    # Pre-classify known types
-    def classify(lemme):
-        if lemme in known_homographs:
-            return 'homograph'
-        return ''
-
     # Build output
     output = nom[['lemme', 'freqlem', 'nbhomogr']].copy()
     output['freqlem'] = output['freqlem'].round(2)
-    output['type'] = output['lemme'].apply(classify)
+    # Pre-classify known types (one vectorized lookup)
+    output['type'] = np.where(output['lemme'].isin(known_homographs), 'homograph', '')
     output['review_notes'] = ''
 
     # Save
@@ -25,6 +25,7 @@ Output: data/professions_check.csv
 """
 
 import sys
+import numpy as np
 import pandas as pd
 
 # Fix Windows console encoding
@@ -35,10 +36,12 @@ from config import (
     LEXIQUE_PATH,
     DATA_DIR,
     PROFESSIONS_CHECK_PATH,
-    FREQ_FILMS_WEIGHT,
-    FREQ_BOOKS_WEIGHT,
     FREQ_MIN_THRESHOLD,
+    LEXIQUE_COLUMNS,
+    load_lemmas_with_freq,
 )
+from lexique_io import load_raw
+from utils import write_csv
 
 
 # Patterns: (m_suffix, f_suffix, pattern_name)
@@ -56,22 +59,25 @@ PROFESSION_PATTERNS = [
 PROFESSION_SUFFIXES_M = ['teur', 'eur', 'ier', 'ien', 'er', 'ant', 'iste']
 
 
-def detect_pattern(form_m: str, form_f: str) -> str:
-    """Detect which pattern applies to m → f transformation."""
-    if pd.isna(form_m) or pd.isna(form_f):
-        return ''
+def detect_patterns(form_m: pd.Series, form_f: pd.Series) -> pd.Series:
+    """
+    Detect which pattern applies to each m → f transformation.
 
-    for m_suf, f_suf, pattern_name in PROFESSION_PATTERNS:
-        if form_m.endswith(m_suf):
-            expected_f = form_m[:-len(m_suf)] + f_suf
-            if form_f == expected_f:
-                return pattern_name
+    One vectorized suffix test per pattern instead of a Python loop per row.
+    Returns '' where a form is missing, 'invariable' for identical forms
+    and 'irregular' when no pattern matches.
+    """
+    pattern = pd.Series('', index=form_m.index)
 
-    # Check invariable (same form)
-    if form_m == form_f:
-        return 'invariable'
+    # Reversed, so earlier (more specific) patterns overwrite later ones
+    for m_suf, f_suf, pattern_name in reversed(PROFESSION_PATTERNS):
+        expected_f = form_m.str.slice(stop=-len(m_suf)) + f_suf
+        matched = form_m.str.endswith(m_suf, na=False) & (form_f == expected_f)
+        pattern = pattern.mask(matched, pattern_name)
 
-    return 'irregular'
+    # Check invariable (same form)
+    unmatched = (pattern == '') & form_m.notna() & form_f.notna()
+    return pattern.mask(unmatched, np.where(form_m == form_f, 'invariable', 'irregular'))
 
 
 def get_nom_forms(df: pd.DataFrame) -> pd.DataFrame:
@@ -80,22 +86,16 @@ def get_nom_forms(df: pd.DataFrame) -> pd.DataFrame:
 
     Returns DataFrame with: lemme, form_m, form_f
     """
-    nom = df[df['cgram'] == 'NOM'].copy()
-
-    # Get masculine singular forms
-    m_sg = nom[(nom['genre'] == 'm') & (nom['nombre'] == 's')][['lemme', 'ortho']].copy()
-    m_sg = m_sg.drop_duplicates(subset='lemme', keep='first')
-    m_sg = m_sg.rename(columns={'ortho': 'form_m'})
+    nom = df[df['cgram'] == 'NOM']
 
-    # Get feminine singular forms
-    f_sg = nom[(nom['genre'] == 'f') & (nom['nombre'] == 's')][['lemme', 'ortho']].copy()
-    f_sg = f_sg.drop_duplicates(subset='lemme', keep='first')
-    f_sg = f_sg.rename(columns={'ortho': 'form_f'})
+    # Singular forms, first one per (lemme, genre) in one groupby, unstacked
+    # once into m/f columns (instead of one filter + dedup + merge per gender)
+    sg = nom.loc[(nom['nombre'] == 's') & nom['genre'].isin(['m', 'f']), ['lemme', 'genre', 'ortho']]
+    forms = sg.groupby(['lemme', 'genre'], observed=True)['ortho'].first(skipna=False).unstack('genre')
 
-    # Merge
-    forms = m_sg.merge(f_sg, on='lemme', how='outer')
-
-    return forms
+    forms = forms.reindex(columns=['m', 'f']).rename(columns={'m': 'form_m', 'f': 'form_f'})
+    forms.columns.name = None
+    return forms.reset_index()
 
 
 def main():
@@ -105,18 +105,14 @@ def main():
 
     DATA_DIR.mkdir(exist_ok=True)
 
-    # Load Lexique
+    # Load Lexique (Parquet cache of the needed columns, see lexique_io.load_raw)
     print("Loading Lexique383...")
-    df = pd.read_csv(LEXIQUE_PATH, sep='\t', low_memory=False, encoding='utf-8')
+    df = load_raw(LEXIQUE_PATH, LEXIQUE_COLUMNS)
 
     # Get lemma frequencies
-    lemmas = df[df['islem'] == 1].copy()
-    lemmas['freqlem'] = (
-        FREQ_FILMS_WEIGHT * lemmas['freqlemfilms2'].fillna(0) +
-        FREQ_BOOKS_WEIGHT * lemmas['freqlemlivres'].fillna(0)
-    )
+    lemmas = load_lemmas_with_freq()
 
-    nom_freq = lemmas[lemmas['cgram'] == 'NOM'][['lemme', 'freqlem']].copy()
+    nom_freq = lemmas.loc[lemmas['cgram'] == 'NOM', ['lemme', 'freqlem']]
     nom_freq = nom_freq[nom_freq['freqlem'] >= FREQ_MIN_THRESHOLD]
 
     print(f"NOM lemmas above threshold ({FREQ_MIN_THRESHOLD}): {len(nom_freq)}")
@@ -128,32 +124,33 @@ def main():
     result = nom_freq.merge(forms, on='lemme', how='left')
     result = result[result['lemme'].notna()]
 
-    # Classify each noun
-    def classify(row):
-        form_m = row['form_m']
-        form_f = row['form_f']
-        lemme = row['lemme']
-
-        has_m = pd.notna(form_m)
-        has_f = pd.notna(form_f)
-
-        if has_m and has_f:
-            pattern = detect_pattern(form_m, form_f)
-            return 'has_both', pattern
-        elif has_m and not has_f:
-            # Check if it SHOULD have feminine (profession-like suffix)
-            for suf in PROFESSION_SUFFIXES_M:
-                if lemme.endswith(suf):
-                    return 'm_only_profession', f'expected f-form (-{suf})'
-            return 'm_only', ''
-        elif has_f and not has_m:
-            return 'f_only', ''
-        else:
-            return 'unknown', ''
-
-    classifications = result.apply(classify, axis=1)
-    result['status'] = classifications.apply(lambda x: x[0])
-    result['pattern'] = classifications.apply(lambda x: x[1])
+    # Classify each noun (column masks instead of a per-row apply)
+    has_m = result['form_m'].notna()
+    has_f = result['form_f'].notna()
+
+    is_both = has_m & has_f
+    is_m_only = has_m & ~has_f
+
+    # First matching profession-like suffix ('' if none): m-only nouns
+    # with such a suffix SHOULD have a feminine form. Only m-only lemmas
+    # are scanned, the other statuses don't use the suffix
+    m_only_lemme = result.loc[is_m_only, 'lemme']
+    prof_suffix = pd.Series('', index=m_only_lemme.index)
+    for suf in reversed(PROFESSION_SUFFIXES_M):
+        prof_suffix = prof_suffix.mask(m_only_lemme.str.endswith(suf), suf)
+    prof_suffix = prof_suffix.reindex(result.index, fill_value='')
+    is_prof = prof_suffix != ''
+
+    result['status'] = np.select(
+        [is_both, is_prof, is_m_only, has_f & ~has_m],
+        ['has_both', 'm_only_profession', 'm_only', 'f_only'],
+        default='unknown',
+    )
+    result['pattern'] = np.select(
+        [is_both, is_prof],
+        [detect_patterns(result['form_m'], result['form_f']), 'expected f-form (-' + prof_suffix + ')'],
+        default='',
+    )
     result['freqlem'] = result['freqlem'].round(2)
 
     # Stats
@@ -163,7 +160,7 @@ def main():
     print(result['status'].value_counts().to_string())
 
     # Professions with both forms
-    has_both = result[result['status'] == 'has_both'].copy()
+    has_both = result[result['status'] == 'has_both']
     has_both = has_both.sort_values('freqlem', ascending=False)
 
     print(f"\n{'=' * 60}")
@@ -178,7 +175,7 @@ def main():
     print(has_both[cols].head(40).to_string(index=False))
 
     # Potential professions missing f-form
-    m_only_prof = result[result['status'] == 'm_only_profession'].copy()
+    m_only_prof = result[result['status'] == 'm_only_profession']
     m_only_prof = m_only_prof.sort_values('freqlem', ascending=False)
 
     print(f"\n{'=' * 60}")
@@ -193,7 +190,7 @@ def main():
     output = pd.concat([has_both, m_only_prof])
     output = output.sort_values(['status', 'freqlem'], ascending=[True, False])
     output = output[['lemme', 'form_m', 'form_f', 'freqlem', 'status', 'pattern']]
-    output.to_csv(PROFESSIONS_CHECK_PATH, index=False, encoding='utf-8')
+    write_csv(output, PROFESSIONS_CHECK_PATH)
     print(f"\n✅ Saved to: {PROFESSIONS_CHECK_PATH}")
 
     # Summary
@@ -15,6 +15,7 @@ Output: data/irregular_adjectives.csv with pattern in notes column
 """
 
 import sys
+import numpy as np
 import pandas as pd
 
 # Fix Windows console encoding
@@ -25,10 +26,12 @@ from config import (
     LEXIQUE_PATH,
     DATA_DIR,
     IRREGULAR_ADJ_PATH,
-    FREQ_FILMS_WEIGHT,
-    FREQ_BOOKS_WEIGHT,
     FREQ_MIN_THRESHOLD,
+    LEXIQUE_COLUMNS,
+    load_lemmas_with_freq,
 )
+from lexique_io import load_raw
+from utils import write_csv
 
 
 # Pattern definitions: (suffix_m, suffix_f, pattern_name)
@@ -69,21 +72,25 @@ PATTERNS = [
 ]
 
 
-def detect_pattern(m: str, f: str) -> str | None:
+def detect_patterns(m: pd.Series, f: pd.Series) -> pd.Series:
     """
-    Detect which pattern applies to m → f transformation.
-    Returns pattern name or None if no pattern matches.
+    Detect which pattern applies to each m → f transformation.
+
+    One vectorized suffix test per pattern instead of a Python loop per row.
+    Returns pattern names, '' where no pattern matches (or a form is missing).
     """
-    if pd.isna(m) or pd.isna(f):
-        return None
+    pattern = pd.Series('', index=m.index)
+
+    # Stems of m, sliced once per suffix length (not once per pattern)
+    stems = {n: m.str.slice(stop=-n) for n in {len(suffix_m) for suffix_m, _, _ in PATTERNS}}
 
-    for suffix_m, suffix_f, pattern_name in PATTERNS:
-        if m.endswith(suffix_m):
-            expected_f = m[:-len(suffix_m)] + suffix_f
-            if f == expected_f:
-                return pattern_name
+    # Reversed, so earlier (more specific) patterns overwrite later ones
+    for suffix_m, suffix_f, pattern_name in reversed(PATTERNS):
+        expected_f = stems[len(suffix_m)] + suffix_f
+        matched = m.str.endswith(suffix_m, na=False) & (f == expected_f)
+        pattern = pattern.mask(matched, pattern_name)
 
-    return None
+    return pattern
 
 
 # Liaison forms to skip (they're separate lemmas but variants of other adjectives)
@@ -105,87 +112,95 @@ def get_adj_forms(df: pd.DataFrame) -> pd.DataFrame:
     - Compound lemmas (mou,mol → mou)
     - Skips liaison forms (bel, vieil, nouvel, fol, mol)
     """
-    adj = df[df['cgram'] == 'ADJ'].copy()
-
-    # Skip liaison forms (they're variants, not separate adjectives)
-    adj = adj[~adj['lemme'].isin(LIAISON_FORMS)]
-
-    # Normalize compound lemmas
-    adj['lemme_norm'] = adj['lemme'].map(COMPOUND_LEMMA_MAP).fillna(adj['lemme'])
-
-    # Get masculine singular forms
-    # Include nombre='s' AND nombre=NaN (for vieux, frais, héros, etc.)
-    m_sg_s = adj[(adj['genre'] == 'm') & (adj['nombre'] == 's')][['lemme_norm', 'ortho']].copy()
-    m_sg_nan = adj[(adj['genre'] == 'm') & adj['nombre'].isna()][['lemme_norm', 'ortho']].copy()
-    m_sg = pd.concat([m_sg_s, m_sg_nan]).drop_duplicates(subset='lemme_norm', keep='first')
-    m_sg = m_sg.rename(columns={'lemme_norm': 'lemme', 'ortho': 'form_m'})
-
-    # Get feminine singular forms from ADJ
-    f_sg_adj = adj[(adj['genre'] == 'f') & (adj['nombre'] == 's')][['lemme_norm', 'ortho']].copy()
-    f_sg_adj = f_sg_adj.rename(columns={'lemme_norm': 'lemme', 'ortho': 'form_f'})
-
-    # Fallback: get feminine forms from NOM for adjectives missing in ADJ
+    adj = df[df['cgram'] == 'ADJ']
+
+    # Skip liaison forms (they're variants, not separate adjectives), and keep
+    # only the rows of the slots used below in the same mask: m and NaN genre
+    # with nombre='s' or NaN, f with nombre='s' (no concat of per-slot frames)
+    singular = (adj['nombre'] == 's') | adj['nombre'].isna()
+    adj = adj[
+        ~adj['lemme'].isin(LIAISON_FORMS)
+        & singular
+        & ((adj['genre'] != 'f') | (adj['nombre'] == 's'))
+    ]
+
+    # Fallback: feminine forms from NOM for adjectives missing in ADJ
     # (nouveau/nouvelle, etc.)
-    nom = df[df['cgram'] == 'NOM'].copy()
-    f_sg_nom = nom[(nom['genre'] == 'f') & (nom['nombre'] == 's')][['lemme', 'ortho']].copy()
-    f_sg_nom = f_sg_nom.rename(columns={'ortho': 'form_f_nom'})
-
-    # Invariable adjectives (genre=NaN, nombre='s')
-    invariable = adj[adj['genre'].isna() & (adj['nombre'] == 's')][['lemme_norm', 'ortho']].copy()
-    invariable = invariable.rename(columns={'lemme_norm': 'lemme', 'ortho': 'form_inv'})
-
-    # Invariable adjectives with nombre=NaN (borrowed words like ok, super, cool)
-    invariable_nan = adj[adj['genre'].isna() & adj['nombre'].isna()][['lemme_norm', 'ortho']].copy()
-    invariable_nan = invariable_nan.rename(columns={'lemme_norm': 'lemme', 'ortho': 'form_inv_nan'})
-
-    # Merge all
-    forms = m_sg.merge(f_sg_adj, on='lemme', how='outer')
-    forms = forms.merge(f_sg_nom, on='lemme', how='outer')
-    forms = forms.merge(invariable, on='lemme', how='outer')
-    forms = forms.merge(invariable_nan, on='lemme', how='outer')
+    nom = df[(df['cgram'] == 'NOM') & (df['genre'] == 'f') & (df['nombre'] == 's')]
+
+    # One long (lemme, role, ortho) frame: ADJ rows by slot (compound lemmas
+    # normalized), NOM f.sg rows as 'f_nom'
+    adj_role = np.select(
+        [
+            (adj['genre'] == 'm') & (adj['nombre'] == 's'),
+            # nombre=NaN for masculine (vieux, frais, héros, etc.)
+            adj['genre'] == 'm',
+            adj['genre'] == 'f',
+            # Invariable adjectives (genre=NaN, nombre='s')
+            adj['nombre'] == 's',
+        ],
+        ['m', 'm_nan', 'f_adj', 'inv'],
+        # Invariable adjectives with nombre=NaN (borrowed words like ok, super, cool)
+        default='inv_nan',
+    )
+    long = pd.concat([
+        pd.DataFrame({'lemme': adj['lemme'].replace(COMPOUND_LEMMA_MAP), 'role': adj_role, 'ortho': adj['ortho']}),
+        pd.DataFrame({'lemme': nom['lemme'], 'role': 'f_nom', 'ortho': nom['ortho']}),
+    ])
+
+    # First form per (lemme, role) in one groupby, unstacked once into one
+    # column per role (instead of an outer merge per role)
+    wide = (
+        long.groupby(['lemme', 'role'])['ortho'].first(skipna=False)
+        .unstack('role')
+        .reindex(columns=['m', 'm_nan', 'f_adj', 'f_nom', 'inv', 'inv_nan'])
+    )
+    forms = pd.DataFrame({
+        'form_m': wide['m'].fillna(wide['m_nan']),
+        'form_f': wide['f_adj'],
+        'form_f_nom': wide['f_nom'],
+        'form_inv': wide['inv'].fillna(wide['inv_nan']),
+    })
 
     # Fill missing:
-    # 1. form_inv_nan → form_inv
-    forms['form_inv'] = forms['form_inv'].fillna(forms['form_inv_nan'])
-    # 2. form_inv → form_m
+    # 1. form_inv → form_m
     forms['form_m'] = forms['form_m'].fillna(forms['form_inv'])
-    # 3. form_f_nom → form_f (fallback to NOM for feminine)
+    # 2. form_f_nom → form_f (fallback to NOM for feminine)
     forms['form_f'] = forms['form_f'].fillna(forms['form_f_nom'])
     forms['form_f'] = forms['form_f'].fillna(forms['form_inv'])
 
-    return forms[['lemme', 'form_m', 'form_f']].drop_duplicates()
+    return forms.reset_index()[['lemme', 'form_m', 'form_f']]
 
 
-def classify_adjective(row: pd.Series) -> tuple[str, str]:
+def classify_adjectives(forms: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
     """
-    Classify adjective and detect pattern.
-    Returns (adj_type, pattern_or_empty).
+    Classify adjectives and detect patterns (whole columns at once).
+    Returns (adj_type, pattern_or_empty) arrays.
     """
-    m = row['form_m']
-    f = row['form_f']
-
-    if pd.isna(m) or pd.isna(f):
-        return 'unknown', ''
-
-    # Invariable: same form
-    if m == f:
-        return 'invariable', ''
-
-    # Regular: f = m + 'e'
-    if f == m + 'e':
-        return 'regular', ''
-
-    # Regular with doubled consonant: bon → bonne, gros → grosse
-    if len(m) >= 1 and f == m + m[-1] + 'e':
-        return 'doubled', ''
+    m = forms['form_m']
+    f = forms['form_f']
+
+    adj_type = np.select(
+        [
+            m.isna() | f.isna(),
+            # Invariable: same form
+            m == f,
+            # Regular: f = m + 'e'
+            f == m + 'e',
+            # Regular with doubled consonant: bon → bonne, gros → grosse
+            f == m + m.str[-1] + 'e',
+        ],
+        ['unknown', 'invariable', 'regular', 'doubled'],
+        default='',
+    )
 
-    # Check for known patterns
-    pattern = detect_pattern(m, f)
-    if pattern:
-        return 'patterned', pattern
+    # Check for known patterns, the rest is truly irregular
+    pattern = detect_patterns(m, f).to_numpy()
+    rest = adj_type == ''
+    adj_type[rest] = np.where(pattern[rest] != '', 'patterned', 'unique')
+    pattern = np.select([adj_type == 'patterned', adj_type == 'unique'], [pattern, 'unique'], default='')
 
-    # Truly irregular
-    return 'unique', 'unique'
+    return adj_type, pattern
 
 
 def main():
@@ -195,17 +210,13 @@ def main():
 
     DATA_DIR.mkdir(exist_ok=True)
 
-    # Load Lexique
-    df = pd.read_csv(LEXIQUE_PATH, sep='\t', low_memory=False, encoding='utf-8')
+    # Load Lexique (Parquet cache of the needed columns, see lexique_io.load_raw)
+    df = load_raw(LEXIQUE_PATH, LEXIQUE_COLUMNS)
 
     # Get lemmas with frequency
-    lemmas = df[df['islem'] == 1].copy()
-    lemmas['freqlem'] = (
-        FREQ_FILMS_WEIGHT * lemmas['freqlemfilms2'].fillna(0) +
-        FREQ_BOOKS_WEIGHT * lemmas['freqlemlivres'].fillna(0)
-    )
+    lemmas = load_lemmas_with_freq()
 
-    adj_lemmas = lemmas[lemmas['cgram'] == 'ADJ'][['lemme', 'freqlem']].copy()
+    adj_lemmas = lemmas.loc[lemmas['cgram'] == 'ADJ', ['lemme', 'freqlem']]
 
     # Filter by threshold
     adj_lemmas = adj_lemmas[adj_lemmas['freqlem'] >= FREQ_MIN_THRESHOLD]
@@ -218,9 +229,7 @@ def main():
     result = adj_lemmas.merge(forms, on='lemme', how='left')
 
     # Classify with pattern detection
-    classifications = result.apply(classify_adjective, axis=1)
-    result['adj_type'] = classifications.apply(lambda x: x[0])
-    result['pattern'] = classifications.apply(lambda x: x[1])
+    result['adj_type'], result['pattern'] = classify_adjectives(result)
     result['freqlem'] = result['freqlem'].round(2)
     result = result.sort_values('freqlem', ascending=False)
 
@@ -239,7 +248,7 @@ def main():
     print(unique[['lemme', 'form_m', 'form_f', 'freqlem']].to_string(index=False))
 
     # Combine patterned + unique for output
-    irregular = result[result['adj_type'].isin(['patterned', 'unique'])].copy()
+    irregular = result[result['adj_type'].isin(['patterned', 'unique'])]
     irregular = irregular[['lemme', 'form_m', 'form_f', 'freqlem', 'pattern']]
     irregular = irregular.rename(columns={'pattern': 'notes'})
 
@@ -247,7 +256,7 @@ def main():
     print(irregular.head(30).to_string(index=False))
 
     # Save
-    irregular.to_csv(IRREGULAR_ADJ_PATH, index=False, encoding='utf-8')
+    write_csv(irregular, IRREGULAR_ADJ_PATH)
     print(f"\nSaved to: {IRREGULAR_ADJ_PATH}")
 
     # Summary by pattern
@@ -17,6 +17,7 @@ Output: data/irregular_verbs.csv
 """
 
 import sys
+import numpy as np
 import pandas as pd
 
 # Fix Windows console encoding
@@ -27,10 +28,12 @@ from config import (
     LEXIQUE_PATH,
     DATA_DIR,
     IRREGULAR_VERBS_PATH,
-    FREQ_FILMS_WEIGHT,
-    FREQ_BOOKS_WEIGHT,
     FREQ_MIN_THRESHOLD,
+    LEXIQUE_COLUMNS,
+    load_lemmas_with_freq,
 )
+from lexique_io import load_raw
+from utils import write_csv
 
 
 # Verbs that are irregular despite -er ending
@@ -122,40 +125,39 @@ IRREGULAR_PATTERNS = {
 }
 
 
-def get_verb_group(lemme: str, participe_present) -> tuple[int, str]:
+def get_verb_groups(lemme: pd.Series, participe_present: pd.Series) -> tuple[np.ndarray, np.ndarray]:
     """
-    Determine verb group and return (group_number, reason).
+    Determine verb groups for whole columns and return (group_numbers, reasons).
 
-    Returns:
+    Conditions are checked in order (first match wins):
+        (3, '-er exception') for aller
         (1, 'regular -er') for 1st group
         (2, 'regular -ir (-issant)') for 2nd group
-        (3, reason) for 3rd group (irregular)
+        (3, reason) for 3rd group (irregular), 'unknown' for other endings
     """
-    # Special case: aller
-    if lemme in IRREGULAR_ER_VERBS:
-        return 3, '-er exception'
-
-    # 1st group: -er verbs (regular)
-    if lemme.endswith('er'):
-        return 1, 'regular -er'
-
-    # -ir verbs: check participe présent
-    if lemme.endswith('ir'):
-        if pd.notna(participe_present) and str(participe_present).endswith('issant'):
-            return 2, 'regular -ir (-issant)'
-        else:
-            return 3, '-ir sans -issant'
-
-    # -re verbs: all 3rd group
-    if lemme.endswith('re'):
-        return 3, '-re'
-
-    # -oir verbs: all 3rd group
-    if lemme.endswith('oir'):
-        return 3, '-oir'
-
-    # Unknown ending
-    return 3, 'unknown'
+    is_ir = lemme.str.endswith('ir', na=False)
+    is_issant = participe_present.str.endswith('issant', na=False)
+
+    conditions = [
+        # Special case: aller
+        lemme.isin(IRREGULAR_ER_VERBS),
+        # 1st group: -er verbs (regular)
+        lemme.str.endswith('er', na=False),
+        # -ir verbs: check participe présent
+        is_ir & is_issant,
+        is_ir,
+        # -re verbs: all 3rd group
+        lemme.str.endswith('re', na=False),
+        # -oir verbs: all 3rd group
+        lemme.str.endswith('oir', na=False),
+    ]
+    # One int8 code per verb (index of the first matching condition, the
+    # last code for an unknown ending), then mapped through small tables
+    groups = np.array([3, 1, 2, 3, 3, 3, 3])
+    reasons = np.array(['-er exception', 'regular -er', 'regular -ir (-issant)', '-ir sans -issant', '-re', '-oir', 'unknown'])
+    codes = np.select(conditions, np.arange(len(conditions), dtype=np.int8), default=len(conditions))
+
+    return groups[codes], reasons[codes]
 
 
 def main():
@@ -165,41 +167,35 @@ def main():
 
     DATA_DIR.mkdir(exist_ok=True)
 
-    # Load Lexique
+    # Load Lexique (Parquet cache of the needed columns, see lexique_io.load_raw)
     print("Loading Lexique383...")
-    df = pd.read_csv(LEXIQUE_PATH, sep='\t', low_memory=False, encoding='utf-8')
+    df = load_raw(LEXIQUE_PATH, LEXIQUE_COLUMNS)
 
     # Get VER lemmas with frequency
-    lemmas = df[df['islem'] == 1].copy()
-    lemmas['freqlem'] = (
-        FREQ_FILMS_WEIGHT * lemmas['freqlemfilms2'].fillna(0) +
-        FREQ_BOOKS_WEIGHT * lemmas['freqlemlivres'].fillna(0)
-    )
+    lemmas = load_lemmas_with_freq()
 
-    ver_lemmas = lemmas[lemmas['cgram'] == 'VER'][['lemme', 'freqlem']].copy()
-    ver_lemmas = ver_lemmas.drop_duplicates(subset='lemme')
+    ver_lemmas = lemmas.loc[lemmas['cgram'] == 'VER', ['lemme', 'freqlem']]
+    ver_lemmas = ver_lemmas.groupby('lemme', sort=False, as_index=False).first(skipna=False)
 
     print(f"Total VER lemmas: {len(ver_lemmas)}")
 
     # Get participe présent for each verb
-    par_pre = df[df['infover'] == 'par:pre;'][['lemme', 'ortho']].copy()
-    par_pre = par_pre.drop_duplicates(subset='lemme', keep='first')
+    par_pre = df.loc[df['infover'] == 'par:pre;', ['lemme', 'ortho']]
+    par_pre = par_pre.groupby('lemme', sort=False, as_index=False).first(skipna=False)
     par_pre = par_pre.rename(columns={'ortho': 'participe_present'})
 
     # Merge
     result = ver_lemmas.merge(par_pre, on='lemme', how='left')
 
     # Classify verbs
-    def classify(row):
-        return get_verb_group(row['lemme'], row['participe_present'])
-
-    classifications = result.apply(classify, axis=1)
-    result['group'] = classifications.apply(lambda x: x[0])
-    result['group_reason'] = classifications.apply(lambda x: x[1])
+    result['group'], result['group_reason'] = get_verb_groups(result['lemme'], result['participe_present'])
     result['freqlem'] = result['freqlem'].round(2)
 
-    # Add pattern notes for known irregular verbs
-    result['notes'] = result['lemme'].map(IRREGULAR_PATTERNS).fillna('')
+    # Add pattern notes for known irregular verbs (hashed left join, not a
+    # per-row dict lookup)
+    notes_map = pd.Series(IRREGULAR_PATTERNS, name='notes')
+    result = result.merge(notes_map, left_on='lemme', right_index=True, how='left')
+    result['notes'] = result['notes'].fillna('')
 
     # Statistics
     print("\n" + "=" * 60)
@@ -218,7 +214,7 @@ def main():
         print(f"  Group {group}: {count} verbs")
 
     # 3rd group (irregular) verbs
-    irregular = result[result['group'] == 3].copy()
+    irregular = result[result['group'] == 3]
     irregular = irregular.sort_values('freqlem', ascending=False)
 
     irregular_freq = irregular[irregular['freqlem'] >= FREQ_MIN_THRESHOLD]
@@ -238,7 +234,7 @@ def main():
     # Save irregular verbs
     output = irregular_freq[['lemme', 'freqlem', 'participe_present', 'group_reason', 'notes']]
     output = output.rename(columns={'group_reason': 'ending_type'})
-    output.to_csv(IRREGULAR_VERBS_PATH, index=False, encoding='utf-8')
+    write_csv(output, IRREGULAR_VERBS_PATH)
     print(f"\n✅ Saved to: {IRREGULAR_VERBS_PATH}")
 
     # Summary for Anki
@@ -16,61 +16,39 @@ Outputs (in output/, regenerable):
 AI content stored in content/ (tracked in git).
 """
 
-import csv
 import re
 from pathlib import Path
-from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+import pandas as pd
+
 from config import (
     PROJECT_ROOT, DATA_DIR, CATEGORIES_DIR, ADDITIONS_DIR, OUTPUT_DIR,
     BLACKLIST_PATH,
     IRREGULAR_ADJ_PATH, IRREGULAR_VERBS_PATH,
+    CATEGORY_COLUMNS,
     get_wordtype,
 )
+from utils import count_lines, read_csv, to_freqlem
 
 
 # =============================================================================
-# Data Classes
+# Columns
 # =============================================================================
 
-@dataclass
-class VocabEntry:
-    """Vocabulary card entry."""
-    french: str
-    wordtype: str
-    notes: str = ""
-    source: str = "lexique"
-    freqlem: float = 0.0
-    cgram: str = ""
-    priority: str = ""  # for quebecismes: high/medium
-
-    def to_row(self) -> dict:
-        return {
-            "French": self.french,
-            "WordType": self.wordtype,
-            "Notes": self.notes,
-            "Source": self.source,
-            "freqlem": f"{self.freqlem:.2f}",
-            "Priority": self.priority,
-        }
-
-
-@dataclass
-class ConjugationEntry:
-    """Conjugation card entry (verb for later tense expansion)."""
-    verb: str
-    notes: str = ""
-    freqlem: float = 0.0
-    group: str = ""  # 1er, 2e, 3e groupe
-
-    def to_row(self) -> dict:
-        return {
-            "Verb": self.verb,
-            "Notes": self.notes,
-            "freqlem": f"{self.freqlem:.2f}",
-            "Group": self.group,
-        }
+# Vocabulary card entries (one DataFrame row per card)
+VOCAB_COLUMNS = ["French", "WordType", "Notes", "Source", "freqlem", "Priority"]
+
+# Conjugation card entries (verb for later tense expansion)
+CONJUGATION_COLUMNS = ["Verb", "Notes", "freqlem", "Group"]
+
+PROFESSIONS_F_COLUMNS = ["lemme", "lemme_m", "freqlem", "notes"]
+QUEBECISMES_COLUMNS = ["word", "pos", "definition", "translation", "priority"]
+VOCABULARY_FIXES_COLUMNS = ["lemme", "wordtype", "notes", "freqlem"]
+BLACKLIST_COLUMNS = ["lemme"]
+IRREGULAR_ADJ_COLUMNS = ["lemme", "form_m", "form_f", "notes"]
+IRREGULAR_VERBS_COLUMNS = ["lemme", "ending_type", "notes"]
 
 
 # =============================================================================
@@ -79,113 +57,68 @@ class ConjugationEntry:
 
 def load_blacklist(path: Path) -> set[str]:
     """Load blacklisted lemmas."""
-    blacklist = set()
     if not path.exists():
-        return blacklist
+        return set()
 
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            lemme = row["lemme"].strip().lower()
-            if lemme:
-                blacklist.add(lemme)
-
-    return blacklist
+    lemmes = read_csv(path, BLACKLIST_COLUMNS)["lemme"].str.strip().str.lower()
+    return set(lemmes[lemmes != ""])
 
 
 def load_irregular_adjectives(path: Path) -> dict[str, tuple[str, str, str]]:
     """Load irregular adjectives: lemme -> (form_m, form_f, notes)."""
-    irregulars = {}
     if not path.exists():
-        return irregulars
-
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            lemme = row["lemme"].lower()
-            form_m = row.get("form_m", "")
-            form_f = row.get("form_f", "")
-            notes = row.get("notes", "")
-            irregulars[lemme] = (form_m, form_f, notes)
+        return {}
 
-    return irregulars
+    df = read_csv(path, IRREGULAR_ADJ_COLUMNS)
+    return dict(zip(df["lemme"].str.lower(), zip(df["form_m"], df["form_f"], df["notes"])))
 
 
 def load_irregular_verbs(path: Path) -> dict[str, tuple[str, str]]:
     """Load irregular verbs: lemme -> (ending_type, notes)."""
-    irregulars = {}
     if not path.exists():
-        return irregulars
-
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            lemme = row["lemme"].lower()
-            ending = row.get("ending_type", "")
-            notes = row.get("notes", "")
-            irregulars[lemme] = (ending, notes)
+        return {}
 
-    return irregulars
+    df = read_csv(path, IRREGULAR_VERBS_COLUMNS)
+    return dict(zip(df["lemme"].str.lower(), zip(df["ending_type"], df["notes"])))
 
 
-def load_category(path: Path) -> list[dict]:
+def load_category(path: Path) -> pd.DataFrame:
     """Load a category CSV file."""
     if not path.exists():
         print(f"  Warning: {path.name} not found")
-        return []
+        return pd.DataFrame(columns=CATEGORY_COLUMNS, dtype=str)
 
-    entries = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            entries.append(row)
+    return read_csv(path, CATEGORY_COLUMNS)
 
-    return entries
 
-
-def load_quebecismes(path: Path) -> list[dict]:
+def load_quebecismes(path: Path) -> pd.DataFrame:
     """Load quebecismes from additions."""
     if not path.exists():
         print(f"  Warning: quebecismes.csv not found")
-        return []
-
-    entries = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            entries.append(row)
+        return pd.DataFrame(columns=QUEBECISMES_COLUMNS, dtype=str)
 
-    return entries
+    df = read_csv(path)
+    if "priority" not in df:
+        df["priority"] = "medium"
+    return df.reindex(columns=QUEBECISMES_COLUMNS, fill_value="")
 
 
-def load_professions_f(path: Path) -> list[dict]:
+def load_professions_f(path: Path) -> pd.DataFrame:
     """Load feminine profession forms."""
     if not path.exists():
         print(f"  Warning: professions_f.csv not found")
-        return []
-
-    entries = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            entries.append(row)
+        return pd.DataFrame(columns=PROFESSIONS_F_COLUMNS, dtype=str)
 
-    return entries
+    return read_csv(path, PROFESSIONS_F_COLUMNS)
 
 
-def load_vocabulary_fixes(path: Path) -> list[dict]:
+def load_vocabulary_fixes(path: Path) -> pd.DataFrame:
     """Load vocabulary fixes (correct forms for blacklisted entries)."""
     if not path.exists():
         print(f"  Warning: vocabulary_fixes.csv not found")
-        return []
+        return pd.DataFrame(columns=VOCABULARY_FIXES_COLUMNS, dtype=str)
 
-    entries = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            entries.append(row)
-
-    return entries
+    return read_csv(path, VOCABULARY_FIXES_COLUMNS)
 
 
 # =============================================================================
@@ -215,6 +148,12 @@ def format_noun(lemme: str, genre: str) -> str:
         return lemme
 
 
+def format_nouns(lemme: pd.Series, genre: pd.Series) -> pd.Series:
+    """Vectorized format_noun() for whole columns."""
+    article = genre.map({"m": "un ", "f": "une ", "m/f": "un/une "}).fillna("")
+    return article + lemme.str.strip()
+
+
 def format_adjective(lemme: str, forms: str, irregular_info: Optional[tuple[str, str, str]]) -> tuple[str, str]:
     """Format adjective with m/f forms. Returns (french, notes)."""
     lemme = lemme.strip()
@@ -245,422 +184,252 @@ def format_adjective(lemme: str, forms: str, irregular_info: Optional[tuple[str,
     return lemme, ""
 
 
-def classify_verb_group(lemme: str, irregular_info: Optional[tuple[str, str]]) -> tuple[str, str]:
-    """Classify verb group. Returns (group, notes)."""
-    lemme_lower = lemme.lower()
-
-    if irregular_info:
-        ending_type, notes = irregular_info
-        return "3e groupe", notes
-
-    # 1st group: -er (except aller)
-    if lemme_lower == "aller":
-        return "3e groupe", "irrégulier"
-
-    if lemme_lower.endswith("er"):
-        return "1er groupe", ""
-
-    # 2nd group: -ir with -issant (need to check participe)
-    # For now, assume regular -ir without info is 2nd group
-    if lemme_lower.endswith("ir"):
-        return "2e groupe", "vérifier participe (-issant)"
+def classify_verb_groups(lemme_lower: pd.Series, irregular_verbs: dict) -> tuple[pd.Series, pd.Series]:
+    """Classify verb groups for a column of lowercased lemmas. Returns (groups, notes).
 
-    # 3rd group: everything else
-    return "3e groupe", ""
+    Conditions are checked in order (first match wins):
+        irregular_verbs entry -> 3e groupe with its notes
+        aller -> 3e groupe, irrégulier
+        -er -> 1er groupe
+        -ir -> 2e groupe (need to check participe: for now, assume regular
+               -ir without info is 2nd group)
+        everything else -> 3e groupe
+    """
+    irregular_notes = lemme_lower.map({verb: notes for verb, (_, notes) in irregular_verbs.items()})
+
+    conditions = [
+        lemme_lower.isin(irregular_verbs.keys()),
+        lemme_lower == "aller",
+        lemme_lower.str.endswith("er"),
+        lemme_lower.str.endswith("ir"),
+    ]
+    groups = np.select(conditions, ["3e groupe", "3e groupe", "1er groupe", "2e groupe"], default="3e groupe")
+    notes = np.select(
+        conditions,
+        [irregular_notes.fillna(""), "irrégulier", "", "vérifier participe (-issant)"],
+        default="",
+    )
+    return pd.Series(groups, index=lemme_lower.index), pd.Series(notes, index=lemme_lower.index)
+
+
+# Quebecisme POS rules as one anchored regex: the alternatives are tried in
+# order (first match wins) and each looks ahead over the whole string, so the
+# rule priority is kept (a plain alternation would pick the leftmost match)
+POS_RE = re.compile(r"""
+    ^(?:
+        # Masculine nouns (various formats)
+        (?=.*?(?P<m>\bn\.?\s*m\.?(?!\s*[/ou])))
+        # Feminine nouns
+      | (?=.*?(?P<f>\bn\.?\s*f\.?))
+        # Common gender (m/f, m ou f)
+      | (?=.*?(?P<mf>\bn\.?\s*m\.?\s*[/ou]\s*f\.?))
+      | (?P<nom>(?=.*?\bnom\b)(?!.*[mf]))
+        # Verbs
+      | (?P<v>(?=.*?\bv[ti]?\.?(?:\s|$))|(?=v))
+        # Adjectives, adverbs, locutions, interjections, expressions
+      | (?=.*?(?P<adj>\badj\.?))
+      | (?=.*?(?P<adv>\badv\.?))
+      | (?=.*?(?P<loc>\bloc\.?))
+      | (?=.*?(?P<interj>\binterj\.?))
+      | (?=.*?(?P<expr>\bexpr\.?))
+    )
+""", re.VERBOSE | re.DOTALL)
+POS_WORDTYPES = {"mf": "m/f", "nom": "m/f"}  # group name -> WordType, if different
 
 
 def pos_to_wordtype(pos: str) -> str:
     """Convert quebecisme POS to Anki WordType."""
     pos_lower = pos.lower().strip()
 
-    # Masculine nouns (various formats)
-    if re.search(r'\bn\.?\s*m\.?(?!\s*[/ou])', pos_lower):
-        return "m"
-
-    # Feminine nouns
-    if re.search(r'\bn\.?\s*f\.?', pos_lower):
-        return "f"
-
-    # Common gender (m/f, m ou f)
-    if re.search(r'\bn\.?\s*m\.?\s*[/ou]\s*f\.?', pos_lower):
-        return "m/f"
-    if re.search(r'\bnom\b', pos_lower) and not re.search(r'[mf]', pos_lower):
-        return "m/f"
+    match = POS_RE.match(pos_lower)
+    if match:
+        return POS_WORDTYPES.get(match.lastgroup, match.lastgroup)
 
-    # Verbs
-    if re.search(r'\bv[ti]?\.?(?:\s|$)', pos_lower) or pos_lower.startswith("v"):
-        return "v"
-
-    # Adjectives
-    if re.search(r'\badj\.?', pos_lower):
-        return "adj"
+    return pos_lower if pos_lower else "?"
 
-    # Adverbs
-    if re.search(r'\badv\.?', pos_lower):
-        return "adv"
 
-    # Locutions
-    if re.search(r'\bloc\.?', pos_lower):
-        return "loc"
+# =============================================================================
+# Processors
+# =============================================================================
 
-    # Interjections
-    if re.search(r'\binterj\.?', pos_lower):
-        return "interj"
+def filter_lemmas(entries: pd.DataFrame, blacklist: set[str]) -> pd.DataFrame:
+    """Strip lemmas, drop blacklisted ones and repeats (case-insensitive, first kept).
 
-    # Expressions
-    if re.search(r'\bexpr\.?', pos_lower):
-        return "expr"
+    The lowercased lemma is kept as 'lemme_lower' (computed once per row).
+    """
+    lemme = entries["lemme"].str.strip()
+    lemme_lower = lemme.str.lower()
+    keep = ~lemme_lower.isin(blacklist) & ~lemme_lower.duplicated()
+    return entries[keep].assign(lemme=lemme[keep], lemme_lower=lemme_lower[keep])
 
-    return pos_lower if pos_lower else "?"
 
+def vocab_frame(french, wordtype, freqlem, source="lexique", notes="", priority="") -> pd.DataFrame:
+    """Build vocabulary entries (VOCAB_COLUMNS) from columns and/or scalars."""
+    return pd.DataFrame({
+        "French": french,
+        "WordType": wordtype,
+        "Notes": notes,
+        "Source": source,
+        "freqlem": freqlem,
+        "Priority": priority,
+    })
 
-# =============================================================================
-# Processors
-# =============================================================================
 
 def process_nouns(
-    entries: list[dict],
+    entries: pd.DataFrame,
     blacklist: set[str],
-    professions_f: list[dict],
-) -> list[VocabEntry]:
+    professions_f: pd.DataFrame,
+) -> pd.DataFrame:
     """Process NOM category."""
-    vocab = []
-    seen = set()
-
-    # Add regular nouns
-    for row in entries:
-        lemme = row["lemme"].strip()
-        if lemme.lower() in blacklist:
-            continue
-        if lemme.lower() in seen:
-            continue
-        seen.add(lemme.lower())
-
-        genre = row.get("genre", "").strip()
-        freqlem = float(row.get("freqlem", 0) or 0)
-
-        french = format_noun(lemme, genre)
-        wordtype = "m" if genre == "m" else "f" if genre == "f" else "m/f"
-
-        vocab.append(VocabEntry(
-            french=french,
-            wordtype=wordtype,
-            freqlem=freqlem,
-            source="lexique",
-            cgram="NOM",
-        ))
-
-    # Add feminine profession forms
-    for row in professions_f:
-        lemme = row["lemme"].strip()
-        if lemme.lower() in blacklist:
-            continue
-        if lemme.lower() in seen:
-            continue
-        seen.add(lemme.lower())
-
-        freqlem = float(row.get("freqlem", 0) or 0)
-        lemme_m = row.get("lemme_m", "")
-        notes = row.get("notes", "")
-
-        french = format_noun(lemme, "f")
-        note_text = f"fém. de {lemme_m}" if lemme_m else notes
-
-        vocab.append(VocabEntry(
-            french=french,
-            wordtype="f",
-            notes=note_text,
-            freqlem=freqlem,
-            source="additions",
-            cgram="NOM",
-        ))
-
-    return vocab
+    # Regular nouns, then feminine profession forms: one filter over both,
+    # so a profession already seen among the nouns is skipped
+    nouns = filter_lemmas(pd.concat([
+        entries.assign(source="lexique"),
+        professions_f.assign(source="additions", genre="f"),
+    ], ignore_index=True), blacklist)
+    is_profession = nouns["source"] == "additions"
+
+    genre = nouns["genre"].str.strip()
+    wordtype = np.select([genre == "m", genre == "f"], ["m", "f"], default="m/f")
+
+    lemme_m = nouns["lemme_m"]
+    notes = ("fém. de " + lemme_m).where(lemme_m != "", nouns["notes"])
+
+    return vocab_frame(
+        format_nouns(nouns["lemme"], genre),
+        wordtype,
+        to_freqlem(nouns["freqlem"]),
+        source=nouns["source"],
+        notes=notes.where(is_profession, ""),
+    )
 
 
 def process_adjectives(
-    entries: list[dict],
+    entries: pd.DataFrame,
     blacklist: set[str],
     irregular_adj: dict,
-) -> list[VocabEntry]:
+) -> pd.DataFrame:
     """Process ADJ category."""
-    vocab = []
-    seen = set()
-
-    for row in entries:
-        lemme = row["lemme"].strip()
-        if lemme.lower() in blacklist:
-            continue
-        if lemme.lower() in seen:
-            continue
-        seen.add(lemme.lower())
+    adj = filter_lemmas(entries, blacklist)
 
-        forms = row.get("forms", "")
-        freqlem = float(row.get("freqlem", 0) or 0)
+    # Forms strings have several layouts: format row by row
+    formatted = pd.DataFrame(
+        [
+            format_adjective(lemme, forms, irregular_adj.get(lemme_lower))
+            for lemme, lemme_lower, forms in zip(adj["lemme"], adj["lemme_lower"], adj["forms"])
+        ],
+        columns=["French", "Notes"],
+        index=adj.index,
+    )
 
-        irregular_info = irregular_adj.get(lemme.lower())
-        french, notes = format_adjective(lemme, forms, irregular_info)
+    return vocab_frame(formatted["French"], "adj", to_freqlem(adj["freqlem"]), notes=formatted["Notes"])
 
-        vocab.append(VocabEntry(
-            french=french,
-            wordtype="adj",
-            notes=notes,
-            freqlem=freqlem,
-            source="lexique",
-            cgram="ADJ",
-        ))
 
-    return vocab
-
-
-def process_adverbs(entries: list[dict], blacklist: set[str]) -> list[VocabEntry]:
+def process_adverbs(entries: pd.DataFrame, blacklist: set[str]) -> pd.DataFrame:
     """Process ADV category."""
-    vocab = []
-    seen = set()
-
-    for row in entries:
-        lemme = row["lemme"].strip()
-        if lemme.lower() in blacklist:
-            continue
-        if lemme.lower() in seen:
-            continue
-        seen.add(lemme.lower())
-
-        freqlem = float(row.get("freqlem", 0) or 0)
-
-        vocab.append(VocabEntry(
-            french=lemme,
-            wordtype="adv",
-            freqlem=freqlem,
-            source="lexique",
-            cgram="ADV",
-        ))
-
-    return vocab
+    adv = filter_lemmas(entries, blacklist)
+    return vocab_frame(adv["lemme"], "adv", to_freqlem(adv["freqlem"]))
 
 
 def process_numerals(
-    entries: list[dict],
+    entries: pd.DataFrame,
     blacklist: set[str],
-) -> list[VocabEntry]:
+) -> pd.DataFrame:
     """Process ADJ:num category (blacklist filtering only)."""
-    vocab = []
-    seen = set()
-
-    for row in entries:
-        lemme = row["lemme"].strip()
-        lemme_lower = lemme.lower()
-
-        if lemme_lower in blacklist:
-            continue
-        if lemme_lower in seen:
-            continue
-        seen.add(lemme_lower)
-
-        freqlem = float(row.get("freqlem", 0) or 0)
+    num = filter_lemmas(entries, blacklist)
+    return vocab_frame(num["lemme"], "num", to_freqlem(num["freqlem"]))
 
-        vocab.append(VocabEntry(
-            french=lemme,
-            wordtype="num",
-            freqlem=freqlem,
-            source="lexique",
-            cgram="ADJ:num",
-        ))
 
-    return vocab
-
-
-def process_other(entries: list[dict], blacklist: set[str]) -> list[VocabEntry]:
+def process_other(entries: pd.DataFrame, blacklist: set[str]) -> pd.DataFrame:
     """Process 'other' category from Lexique383.
 
     Includes: ART (articles), PRO (pronouns), CON (conjunctions),
     PRE (prepositions), ART:def/ind, PRO:per/dem/rel/int, etc.
     Excludes: AUX (auxiliaries) - they come from VER with better notes.
     """
-    vocab = []
-    seen = set()
-
-    for row in entries:
-        lemme = row["lemme"].strip()
-        cgram = row.get("cgram", "")
-
-        # Skip auxiliaries - they come from VER category
-        if cgram == "AUX":
-            continue
+    # Skip auxiliaries - they come from VER category
+    other = filter_lemmas(entries[entries["cgram"] != "AUX"], blacklist)
 
-        if lemme.lower() in blacklist:
-            continue
-        if lemme.lower() in seen:
-            continue
-        seen.add(lemme.lower())
+    wordtype = [get_wordtype(cgram, genre) for cgram, genre in zip(other["cgram"], other["genre"])]
 
-        genre = row.get("genre", "")
-        freqlem = float(row.get("freqlem", 0) or 0)
+    return vocab_frame(other["lemme"], wordtype, to_freqlem(other["freqlem"]))
 
-        wordtype = get_wordtype(cgram, genre)
 
-        vocab.append(VocabEntry(
-            french=lemme,
-            wordtype=wordtype,
-            freqlem=freqlem,
-            source="lexique",
-            cgram=cgram,
-        ))
-
-    return vocab
-
-
-def process_onomatopoeia(entries: list[dict], blacklist: set[str]) -> list[VocabEntry]:
+def process_onomatopoeia(entries: pd.DataFrame, blacklist: set[str]) -> pd.DataFrame:
     """Process ONO (onomatopoeia/interjections) category."""
-    vocab = []
-    seen = set()
-
-    for row in entries:
-        lemme = row["lemme"].strip()
-        if lemme.lower() in blacklist:
-            continue
-        if lemme.lower() in seen:
-            continue
-        seen.add(lemme.lower())
-
-        freqlem = float(row.get("freqlem", 0) or 0)
-
-        vocab.append(VocabEntry(
-            french=lemme,
-            wordtype="interj",
-            freqlem=freqlem,
-            source="lexique",
-            cgram="ONO",
-        ))
-
-    return vocab
+    ono = filter_lemmas(entries, blacklist)
+    return vocab_frame(ono["lemme"], "interj", to_freqlem(ono["freqlem"]))
 
 
 def process_verbs(
-    entries: list[dict],
+    entries: pd.DataFrame,
     blacklist: set[str],
     irregular_verbs: dict,
-) -> list[ConjugationEntry]:
+) -> pd.DataFrame:
     """Process VER category for conjugation cards."""
-    conj = []
-    seen = set()
-
-    for row in entries:
-        lemme = row["lemme"].strip()
-        if lemme.lower() in blacklist:
-            continue
-        if lemme.lower() in seen:
-            continue
-        seen.add(lemme.lower())
-
-        freqlem = float(row.get("freqlem", 0) or 0)
+    verbs = filter_lemmas(entries, blacklist)
+    group, notes = classify_verb_groups(verbs["lemme_lower"], irregular_verbs)
 
-        irregular_info = irregular_verbs.get(lemme.lower())
-        group, notes = classify_verb_group(lemme, irregular_info)
-
-        conj.append(ConjugationEntry(
-            verb=lemme,
-            notes=notes,
-            freqlem=freqlem,
-            group=group,
-        ))
-
-    return conj
+    return pd.DataFrame({
+        "Verb": verbs["lemme"],
+        "Notes": notes,
+        "freqlem": to_freqlem(verbs["freqlem"]),
+        "Group": group,
+    })
 
 
 def process_verbs_for_vocab(
-    entries: list[dict],
+    entries: pd.DataFrame,
     blacklist: set[str],
     irregular_verbs: dict,
-) -> list[VocabEntry]:
+) -> pd.DataFrame:
     """Process VER category for vocabulary cards (infinitive form)."""
-    vocab = []
-    seen = set()
+    verbs = filter_lemmas(entries, blacklist)
+    group, notes = classify_verb_groups(verbs["lemme_lower"], irregular_verbs)
 
-    for row in entries:
-        lemme = row["lemme"].strip()
-        if lemme.lower() in blacklist:
-            continue
-        if lemme.lower() in seen:
-            continue
-        seen.add(lemme.lower())
+    # Add group info to notes
+    notes = (group + ", " + notes).where(notes != "", group)
 
-        freqlem = float(row.get("freqlem", 0) or 0)
-
-        irregular_info = irregular_verbs.get(lemme.lower())
-        group, notes = classify_verb_group(lemme, irregular_info)
-
-        # Add group info to notes
-        if notes:
-            notes = f"{group}, {notes}"
-        else:
-            notes = group
+    return vocab_frame(verbs["lemme"], "v", to_freqlem(verbs["freqlem"]), notes=notes)
 
-        vocab.append(VocabEntry(
-            french=lemme,
-            wordtype="v",
-            notes=notes,
-            freqlem=freqlem,
-            source="lexique",
-            cgram="VER",
-        ))
 
-    return vocab
-
-
-def process_vocabulary_fixes(entries: list[dict]) -> list[VocabEntry]:
+def process_vocabulary_fixes(entries: pd.DataFrame) -> pd.DataFrame:
     """Process vocabulary fixes (correct forms for blacklisted/wrong entries)."""
-    vocab = []
-
-    for row in entries:
-        lemme = row["lemme"].strip()
-        wordtype = row.get("wordtype", "").strip()
-        notes = row.get("notes", "")
-        freqlem = float(row.get("freqlem", 0) or 0)
+    lemmes = entries["lemme"].str.strip()
+    wordtypes = entries["wordtype"].str.strip()
+    french = []
 
+    for lemme, wordtype in zip(lemmes, wordtypes):
         # Format based on wordtype
         if wordtype in ("m", "f", "m/f"):
-            french = format_noun(lemme, wordtype)
+            french.append(format_noun(lemme, wordtype))
         elif wordtype in ("m pl", "f pl"):
             # Pluralia tantum - use "les" or "des"
             if lemme in ("vacances",):
-                french = f"des {lemme}"
+                french.append(f"des {lemme}")
             else:
-                french = f"les {lemme}"
+                french.append(f"les {lemme}")
         else:
-            french = lemme
-
-        vocab.append(VocabEntry(
-            french=french,
-            wordtype=wordtype,
-            notes=notes,
-            freqlem=freqlem,
-            source="additions",
-            cgram="FIX",
-        ))
+            french.append(lemme)
 
-    return vocab
+    return vocab_frame(
+        pd.Series(french, index=entries.index, dtype=str),
+        wordtypes,
+        to_freqlem(entries["freqlem"]).astype(float),
+        source="additions",
+        notes=entries["notes"],
+    )
 
 
-def process_quebecismes(entries: list[dict], blacklist: set[str]) -> list[VocabEntry]:
+def process_quebecismes(entries: pd.DataFrame, blacklist: set[str]) -> pd.DataFrame:
     """Process quebecismes from additions."""
-    vocab = []
-    seen = set()
-
-    for row in entries:
-        word = row.get("word", "").strip()
-        if not word:
-            continue
-
-        # Lowercase (source data has Title Case)
-        word = word.lower()
-
-        if word in blacklist:
-            continue
-        if word in seen:
-            continue
-        seen.add(word)
+    # Lowercase (source data has Title Case), then drop empty, blacklisted
+    # and repeated words in one vectorized pass (first kept)
+    words = entries["word"].str.strip().str.lower()
+    keep = (words != "") & ~words.isin(blacklist) & ~words.duplicated()
 
+    vocab = []
+    for word, row in zip(words[keep], entries[keep].to_dict("records")):
         pos = row.get("pos", "")
         definition = row.get("definition", "")
         translation = row.get("translation", "")
@@ -685,16 +454,28 @@ def process_quebecismes(entries: list[dict], blacklist: set[str]) -> list[VocabE
             else:
                 notes = translation
 
-        vocab.append(VocabEntry(
-            french=french,
-            wordtype=wordtype,
-            notes=notes,
-            source="quebecismes",
-            freqlem=0,
-            priority=priority,
-        ))
+        vocab.append({
+            "French": french,
+            "WordType": wordtype,
+            "Notes": notes,
+            "Source": "quebecismes",
+            "freqlem": 0.0,
+            "Priority": priority,
+        })
+
+    return pd.DataFrame(vocab, columns=VOCAB_COLUMNS).astype({"freqlem": float})
+
+
+# =============================================================================
+# Writers
+# =============================================================================
 
-    return vocab
+def write_skeleton(entries: pd.DataFrame, path: Path, columns: list[str]) -> None:
+    """Write entries to CSV: freqlem with 2 decimals, csv module line endings."""
+    entries.to_csv(
+        path, columns=columns, index=False, encoding="utf-8",
+        float_format="%.2f", lineterminator="\r\n",
+    )
 
 
 # =============================================================================
@@ -741,74 +522,81 @@ def main():
     print("PROCESSING VOCABULARY")
     print("=" * 60)
 
-    all_vocab: list[VocabEntry] = []
+    vocab_parts: list[pd.DataFrame] = []
 
     # Nouns
     print("\nProcessing NOM...")
     nom_entries = load_category(CATEGORIES_DIR / "NOM.csv")
     nom_vocab = process_nouns(nom_entries, blacklist, professions_f)
     print(f"  NOM: {len(nom_vocab)} entries")
-    all_vocab.extend(nom_vocab)
+    vocab_parts.append(nom_vocab)
 
     # Adjectives
     print("\nProcessing ADJ...")
     adj_entries = load_category(CATEGORIES_DIR / "ADJ.csv")
     adj_vocab = process_adjectives(adj_entries, blacklist, irregular_adj)
     print(f"  ADJ: {len(adj_vocab)} entries")
-    all_vocab.extend(adj_vocab)
+    vocab_parts.append(adj_vocab)
 
     # Adverbs
     print("\nProcessing ADV...")
     adv_entries = load_category(CATEGORIES_DIR / "ADV.csv")
     adv_vocab = process_adverbs(adv_entries, blacklist)
     print(f"  ADV: {len(adv_vocab)} entries")
-    all_vocab.extend(adv_vocab)
+    vocab_parts.append(adv_vocab)
 
     # Numerals
     print("\nProcessing ADJ:num...")
     num_entries = load_category(CATEGORIES_DIR / "ADJ_num.csv")
     num_vocab = process_numerals(num_entries, blacklist)
     print(f"  ADJ:num: {len(num_vocab)} entries")
-    all_vocab.extend(num_vocab)
+    vocab_parts.append(num_vocab)
 
     # Other (determiners, pronouns)
     print("\nProcessing other...")
     other_entries = load_category(CATEGORIES_DIR / "other.csv")
     other_vocab = process_other(other_entries, blacklist)
     print(f"  other: {len(other_vocab)} entries")
-    all_vocab.extend(other_vocab)
+    vocab_parts.append(other_vocab)
 
     # Onomatopoeia
     print("\nProcessing ONO...")
     ono_entries = load_category(CATEGORIES_DIR / "ONO.csv")
     ono_vocab = process_onomatopoeia(ono_entries, blacklist)
     print(f"  ONO: {len(ono_vocab)} entries")
-    all_vocab.extend(ono_vocab)
+    vocab_parts.append(ono_vocab)
 
     # Verbs (infinitive for vocabulary)
     print("\nProcessing VER (for vocabulary)...")
     ver_entries = load_category(CATEGORIES_DIR / "VER.csv")
     ver_vocab = process_verbs_for_vocab(ver_entries, blacklist, irregular_verbs)
     print(f"  VER: {len(ver_vocab)} entries")
-    all_vocab.extend(ver_vocab)
+    vocab_parts.append(ver_vocab)
 
     # Québécismes (kept separate for different processing)
     print("\nProcessing québécismes...")
     qc_vocab = process_quebecismes(quebecismes, blacklist)
     print(f"  québécismes: {len(qc_vocab)} entries (separate file)")
-    # NOT extending all_vocab - québécismes are saved separately
+    # NOT added to vocab_parts - québécismes are saved separately
 
     # Vocabulary fixes (correct forms for blacklisted entries)
     print("\nProcessing vocabulary fixes...")
     fix_vocab = process_vocabulary_fixes(vocabulary_fixes)
     print(f"  Fixes: {len(fix_vocab)} entries")
-    all_vocab.extend(fix_vocab)
+    vocab_parts.append(fix_vocab)
 
-    # Sort vocabulary by frequency (descending)
-    all_vocab.sort(key=lambda x: (-x.freqlem, x.french.lower()))
+    # Sort vocabulary by frequency (descending), then alphabetically. Sort
+    # keys are extra columns, left out when writing (write_skeleton columns)
+    all_vocab = pd.concat(vocab_parts, ignore_index=True)
+    # WordType/Source hold ~10 distinct values: codes + one shared set of strings
+    all_vocab = all_vocab.astype({"WordType": "category", "Source": "category"})
+    all_vocab["french_lower"] = all_vocab["French"].str.lower()
+    all_vocab = all_vocab.sort_values(["freqlem", "french_lower"], ascending=[False, True])
 
     # Sort québécismes by priority (high first), then alphabetically
-    qc_vocab.sort(key=lambda x: (0 if x.priority == "high" else 1, x.french.lower()))
+    qc_vocab["not_high"] = qc_vocab["Priority"] != "high"
+    qc_vocab["french_lower"] = qc_vocab["French"].str.lower()
+    qc_vocab = qc_vocab.sort_values(["not_high", "french_lower"])
 
     print(f"\n  TOTAL vocabulary: {len(all_vocab)} entries")
     print(f"  TOTAL québécismes: {len(qc_vocab)} entries")
@@ -823,17 +611,16 @@ def main():
     print("\nProcessing VER (for conjugation)...")
     # ver_entries already loaded above
     all_conj = process_verbs(ver_entries, blacklist, irregular_verbs)
+    all_conj["Group"] = all_conj["Group"].astype("category")
     print(f"  VER: {len(all_conj)} entries")
 
     # Sort by frequency (descending)
-    all_conj.sort(key=lambda x: (-x.freqlem, x.verb.lower()))
+    all_conj["verb_lower"] = all_conj["Verb"].str.lower()
+    all_conj = all_conj.sort_values(["freqlem", "verb_lower"], ascending=[False, True])
 
     # Group statistics
-    groups = {}
-    for c in all_conj:
-        groups[c.group] = groups.get(c.group, 0) + 1
     print("\n  By group:")
-    for g, count in sorted(groups.items()):
+    for g, count in all_conj["Group"].value_counts().sort_index().items():
         print(f"    {g}: {count}")
 
     # ==========================================================================
@@ -847,38 +634,23 @@ def main():
     vocab_path = OUTPUT_DIR / "vocabulary_skeleton.csv"
     print(f"\nSaving vocabulary to {vocab_path}...")
 
-    fieldnames = ["French", "WordType", "Notes", "Source", "freqlem", "Priority"]
-    with open(vocab_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for entry in all_vocab:
-            writer.writerow(entry.to_row())
+    write_skeleton(all_vocab, vocab_path, VOCAB_COLUMNS)
     print(f"  Saved {len(all_vocab)} entries")
 
     # Québécismes skeleton (no freqlem - all are 0)
     qc_path = OUTPUT_DIR / "quebecismes_skeleton.csv"
     print(f"\nSaving québécismes to {qc_path}...")
 
-    qc_fieldnames = ["French", "WordType", "Notes", "Source", "Priority"]
-    with open(qc_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=qc_fieldnames)
-        writer.writeheader()
-        for entry in qc_vocab:
-            row = entry.to_row()
-            del row["freqlem"]  # remove freqlem (always 0 for quebecismes)
-            writer.writerow(row)
+    # freqlem left out (always 0 for quebecismes)
+    qc_columns = [col for col in VOCAB_COLUMNS if col != "freqlem"]
+    write_skeleton(qc_vocab, qc_path, qc_columns)
     print(f"  Saved {len(qc_vocab)} entries")
 
     # Conjugation skeleton
     conj_path = OUTPUT_DIR / "conjugation_skeleton.csv"
     print(f"\nSaving conjugation to {conj_path}...")
 
-    fieldnames = ["Verb", "Notes", "freqlem", "Group"]
-    with open(conj_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for entry in all_conj:
-            writer.writerow(entry.to_row())
+    write_skeleton(all_conj, conj_path, CONJUGATION_COLUMNS)
     print(f"  Saved {len(all_conj)} entries")
 
     # ==========================================================================
@@ -887,8 +659,7 @@ def main():
     expressions_path = PROJECT_ROOT / "content" / "expressions" / "all.csv"
     expr_count = 0
     if expressions_path.exists():
-        with open(expressions_path, "r", encoding="utf-8") as f:
-            expr_count = sum(1 for _ in f) - 1
+        expr_count = count_lines(expressions_path) - 1
 
     # ==========================================================================
     # Summary
@@ -13,6 +13,7 @@ Outputs (in output/):
 """
 
 import csv
+from operator import attrgetter
 from pathlib import Path
 from dataclasses import dataclass
 
@@ -21,13 +22,27 @@ from config import (
     SAMPLE_1ER_GROUPE, SAMPLE_2E_GROUPE, ETRE_VERBS,
     SUBJONCTIF_IRREGULIERS, FUTUR_STEMS, PARTICIPES_IRREGULIERS,
 )
+from utils import read_csv, to_freqlem
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+ETRE_SET = frozenset(ETRE_VERBS)
+
+# Présent patterns of 1er groupe samples (default: "-er régulier")
+PRESENT_1ER_PATTERNS = {
+    "manger": "-ger (nous mangeons)",
+    "commencer": "-cer (nous commençons)",
+}
 
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PresentEntry:
     """Présent conjugation card."""
     verb: str
@@ -35,29 +50,29 @@ class PresentEntry:
     pattern: str = ""
     freqlem: float = 0.0
 
-    def to_row(self) -> dict:
-        return {
-            "Verb": self.verb,
-            "Group": self.group,
-            "Pattern": self.pattern,
-            "freqlem": f"{self.freqlem:.2f}",
-        }
+    def as_tuple(self) -> tuple:
+        return (
+            self.verb,
+            self.group,
+            self.pattern,
+            f"{self.freqlem:.2f}",
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class SubjonctifEntry:
     """Subjonctif présent card (irregular only)."""
     verb: str
     freqlem: float = 0.0
 
-    def to_row(self) -> dict:
-        return {
-            "Verb": self.verb,
-            "freqlem": f"{self.freqlem:.2f}",
-        }
+    def as_tuple(self) -> tuple:
+        return (
+            self.verb,
+            f"{self.freqlem:.2f}",
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ParticipeEntry:
     """Participe passé card (irregular only)."""
     verb: str
@@ -67,110 +82,109 @@ class ParticipeEntry:
     related: str = ""
     freqlem: float = 0.0
 
-    def to_row(self) -> dict:
-        return {
-            "Verb": self.verb,
-            "Participe": self.participe,
-            "Auxiliaire": self.auxiliaire,
-            "Pattern": self.pattern,
-            "Related": self.related,
-            "freqlem": f"{self.freqlem:.2f}",
-        }
+    def as_tuple(self) -> tuple:
+        return (
+            self.verb,
+            self.participe,
+            self.auxiliaire,
+            self.pattern,
+            self.related,
+            f"{self.freqlem:.2f}",
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class FuturStemEntry:
     """Futur/Conditionnel stem card (irregular only)."""
     verb: str
     stem: str
     freqlem: float = 0.0
 
-    def to_row(self) -> dict:
-        return {
-            "Verb": self.verb,
-            "FuturStem": self.stem,
-            "freqlem": f"{self.freqlem:.2f}",
-        }
+    def as_tuple(self) -> tuple:
+        return (
+            self.verb,
+            self.stem,
+            f"{self.freqlem:.2f}",
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class EtreVerbEntry:
     """Être auxiliary verb card."""
     verb: str
     participe: str = ""
     freqlem: float = 0.0
 
-    def to_row(self) -> dict:
-        return {
-            "Verb": self.verb,
-            "Participe": self.participe,
-            "freqlem": f"{self.freqlem:.2f}",
-        }
+    def as_tuple(self) -> tuple:
+        return (
+            self.verb,
+            self.participe,
+            f"{self.freqlem:.2f}",
+        )
 
 
 # =============================================================================
 # Loaders
 # =============================================================================
 
-def load_verbs_from_category() -> dict[str, tuple[float, str]]:
-    """Load verbs from VER.csv. Returns verb -> (freqlem, notes)."""
+def load_verbs_from_category() -> dict[str, float]:
+    """Load verbs from VER.csv. Returns verb -> freqlem."""
     path = CATEGORIES_DIR / "VER.csv"
-    verbs = {}
 
     if not path.exists():
         print(f"  Warning: {path} not found")
-        return verbs
+        return {}
 
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            lemme = row["lemme"].strip().lower()
-            freqlem = float(row.get("freqlem", 0) or 0)
-            verbs[lemme] = (freqlem, "")
-
-    return verbs
+    df = read_csv(path, ["lemme", "freqlem"])
+    lemmes = df["lemme"].str.strip().str.lower()
+    freqlem = to_freqlem(df["freqlem"])
+    return dict(zip(lemmes, freqlem.tolist()))
 
 
 def load_irregular_verbs() -> dict[str, str]:
     """Load irregular verbs with their patterns. Returns verb -> pattern."""
     path = IRREGULAR_VERBS_PATH
-    irregulars = {}
 
     if not path.exists():
         print(f"  Warning: {path} not found")
-        return irregulars
-
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            lemme = row["lemme"].strip().lower()
-            ending = row.get("ending_type", "")
-            notes = row.get("notes", "")
-            pattern = f"{ending} ({notes})" if notes else ending
-            irregulars[lemme] = pattern
+        return {}
 
-    return irregulars
+    df = read_csv(path, ["lemme", "ending_type", "notes"])
+    lemmes = df["lemme"].str.strip().str.lower()
+    ending = df["ending_type"]
+    with_notes = ending + " (" + df["notes"] + ")"
+    patterns = with_notes.where(df["notes"] != "", ending)
+    return dict(zip(lemmes, patterns))
 
 
 # =============================================================================
 # Generators
 # =============================================================================
 
+def sort_by_freqlem(entries: list) -> None:
+    """Sort entries in place by freqlem (descending), then verb.
+
+    Two stable sorts with C-level attrgetter keys: no (-freqlem, verb)
+    tuple per entry.
+    """
+    entries.sort(key=attrgetter("verb"))
+    entries.sort(key=attrgetter("freqlem"), reverse=True)
+
+
 def generate_present_entries(
-    verbs: dict[str, tuple[float, str]],
+    freqlems: dict[str, float],
     irregular_patterns: dict[str, str],
 ) -> list[PresentEntry]:
     """Generate Présent entries for 3e groupe + samples."""
     entries = []
-    seen = set()
+    # Dict keys are already unique: the 3e groupe loop needs no check
+    seen = set(irregular_patterns)
+    seen_add = seen.add
+    get_freqlem = freqlems.get
 
     # 1. Add 3e groupe verbs (irregular)
     for verb, pattern in irregular_patterns.items():
-        if verb in seen:
-            continue
-        seen.add(verb)
-
-        freqlem = verbs.get(verb, (0.0, ""))[0]
+        freqlem = get_freqlem(verb, 0.0)
         entries.append(PresentEntry(
             verb=verb,
             group="3e groupe",
@@ -182,19 +196,13 @@ def generate_present_entries(
     for verb in SAMPLE_1ER_GROUPE:
         if verb in seen:
             continue
-        seen.add(verb)
-
-        freqlem = verbs.get(verb, (0.0, ""))[0]
-        pattern = "-er régulier"
-        if verb == "manger":
-            pattern = "-ger (nous mangeons)"
-        elif verb == "commencer":
-            pattern = "-cer (nous commençons)"
+        seen_add(verb)
 
+        freqlem = get_freqlem(verb, 0.0)
         entries.append(PresentEntry(
             verb=verb,
             group="1er groupe",
-            pattern=pattern,
+            pattern=PRESENT_1ER_PATTERNS.get(verb, "-er régulier"),
             freqlem=freqlem,
         ))
 
@@ -202,9 +210,9 @@ def generate_present_entries(
     for verb in SAMPLE_2E_GROUPE:
         if verb in seen:
             continue
-        seen.add(verb)
+        seen_add(verb)
 
-        freqlem = verbs.get(verb, (0.0, ""))[0]
+        freqlem = get_freqlem(verb, 0.0)
         entries.append(PresentEntry(
             verb=verb,
             group="2e groupe",
@@ -213,34 +221,33 @@ def generate_present_entries(
         ))
 
     # Sort by frequency
-    entries.sort(key=lambda x: (-x.freqlem, x.verb))
+    sort_by_freqlem(entries)
     return entries
 
 
 def generate_subjonctif_entries(
-    verbs: dict[str, tuple[float, str]],
+    freqlems: dict[str, float],
 ) -> list[SubjonctifEntry]:
     """Generate Subjonctif entries for irregular verbs only."""
     entries = []
 
     for verb in SUBJONCTIF_IRREGULIERS:
-        freqlem = verbs.get(verb, (0.0, ""))[0]
+        freqlem = freqlems.get(verb, 0.0)
         entries.append(SubjonctifEntry(verb=verb, freqlem=freqlem))
 
-    entries.sort(key=lambda x: (-x.freqlem, x.verb))
+    sort_by_freqlem(entries)
     return entries
 
 
 def generate_participe_entries(
-    verbs: dict[str, tuple[float, str]],
+    freqlems: dict[str, float],
 ) -> list[ParticipeEntry]:
     """Generate Participe passé entries for irregular verbs."""
     entries = []
-    etre_set = set(ETRE_VERBS)
 
     for verb, (participe, pattern, related) in PARTICIPES_IRREGULIERS.items():
-        freqlem = verbs.get(verb, (0.0, ""))[0]
-        auxiliaire = "être" if verb in etre_set else "avoir"
+        freqlem = freqlems.get(verb, 0.0)
+        auxiliaire = "être" if verb in ETRE_SET else "avoir"
 
         entries.append(ParticipeEntry(
             verb=verb,
@@ -251,32 +258,32 @@ def generate_participe_entries(
             freqlem=freqlem,
         ))
 
-    entries.sort(key=lambda x: (-x.freqlem, x.verb))
+    sort_by_freqlem(entries)
     return entries
 
 
 def generate_futur_stem_entries(
-    verbs: dict[str, tuple[float, str]],
+    freqlems: dict[str, float],
 ) -> list[FuturStemEntry]:
     """Generate Futur stem entries for irregular verbs."""
     entries = []
 
     for verb, stem in FUTUR_STEMS.items():
-        freqlem = verbs.get(verb, (0.0, ""))[0]
+        freqlem = freqlems.get(verb, 0.0)
         entries.append(FuturStemEntry(verb=verb, stem=stem, freqlem=freqlem))
 
-    entries.sort(key=lambda x: (-x.freqlem, x.verb))
+    sort_by_freqlem(entries)
     return entries
 
 
 def generate_etre_verb_entries(
-    verbs: dict[str, tuple[float, str]],
+    freqlems: dict[str, float],
 ) -> list[EtreVerbEntry]:
     """Generate être auxiliary verb entries."""
     entries = []
 
     for verb in ETRE_VERBS:
-        freqlem = verbs.get(verb, (0.0, ""))[0]
+        freqlem = freqlems.get(verb, 0.0)
 
         # Get participe from PARTICIPES_IRREGULIERS if available
         participe = ""
@@ -293,7 +300,7 @@ def generate_etre_verb_entries(
             freqlem=freqlem,
         ))
 
-    entries.sort(key=lambda x: (-x.freqlem, x.verb))
+    sort_by_freqlem(entries)
     return entries
 
 
@@ -302,12 +309,11 @@ def generate_etre_verb_entries(
 # =============================================================================
 
 def write_csv(path: Path, entries: list, fieldnames: list[str]) -> int:
-    """Write entries to CSV file."""
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for entry in entries:
-            writer.writerow(entry.to_row())
+    """Write entries to CSV file (fieldnames in as_tuple() order)."""
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(fieldnames)
+        writer.writerows(entry.as_tuple() for entry in entries)
     return len(entries)
 
 
@@ -11,14 +11,24 @@ Output: data/quebecismes/<source>.csv
 """
 
 import csv
+import gzip
+import hashlib
+import io
 import json
 import re
+import shutil
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPSConnection, HTTPException
 from pathlib import Path
 from urllib.request import urlopen, Request
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote, urlencode
-from html.parser import HTMLParser
+from html import unescape
+
+from utils import count_lines
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -27,19 +37,79 @@ QUEBECISMES_DIR = PROJECT_ROOT / "data" / "quebecismes"
 # Ensure output directory exists
 QUEBECISMES_DIR.mkdir(parents=True, exist_ok=True)
 
+# Fetched pages, gzipped, keyed by URL (reused for CACHE_TTL seconds)
+CACHE_DIR = QUEBECISMES_DIR / ".cache"
+CACHE_TTL = 24 * 60 * 60
+
 # User agent for requests
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
 
+def cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.gz"
+
+
+def read_cache(url: str) -> str | None:
+    """Cached content of url, None if missing, expired or unreadable."""
+    path = cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime >= CACHE_TTL:
+            return None
+        with gzip.open(path, "rb") as f:
+            return f.read().decode("utf-8")
+    except (OSError, EOFError, UnicodeDecodeError):
+        return None
+
+
+def write_cache(url: str, content: str) -> None:
+    """Cache content of url (one compressed write, then an atomic rename).
+
+    Best effort: a failed write (full disk, read-only data/) only skips the
+    cache, the fetched content is still used.
+    """
+    path = cache_path(url)
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path.write_bytes(gzip.compress(content.encode("utf-8"), compresslevel=1))
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"  Cache not written: {e}")
+
+
 def fetch_url(url: str, retries: int = 3, delay: float = 1.0) -> str:
-    """Fetch URL content with retries."""
+    """Fetch URL content with retries (from the cache while it is fresh)."""
+    content = read_cache(url)
+    if content is not None:
+        return content
+
     headers = {"User-Agent": USER_AGENT}
 
     for attempt in range(retries):
         try:
             req = Request(url, headers=headers)
             with urlopen(req, timeout=30) as response:
-                return response.read().decode("utf-8")
+                content = response.read().decode("utf-8")
+            write_cache(url, content)
+            return content
+        except (HTTPError, URLError) as e:
+            print(f"  Attempt {attempt + 1}/{retries} failed: {e}")
+            if attempt < retries - 1:
+                time.sleep(delay)
+
+    raise Exception(f"Failed to fetch {url} after {retries} attempts")
+
+
+def download_url(url: str, path: Path, retries: int = 3, delay: float = 1.0) -> None:
+    """Stream URL content to path with retries (1 MiB chunks, never whole in memory)."""
+    headers = {"User-Agent": USER_AGENT}
+
+    for attempt in range(retries):
+        try:
+            req = Request(url, headers=headers)
+            with urlopen(req, timeout=30) as response, open(path, "wb", buffering=1 << 20) as f:
+                shutil.copyfileobj(response, f, length=1 << 20)
+            return
         except (HTTPError, URLError) as e:
             print(f"  Attempt {attempt + 1}/{retries} failed: {e}")
             if attempt < retries - 1:
@@ -48,6 +118,39 @@ def fetch_url(url: str, retries: int = 3, delay: float = 1.0) -> str:
     raise Exception(f"Failed to fetch {url} after {retries} attempts")
 
 
+def fetch_path(conn: HTTPSConnection, path: str, retries: int = 3, delay: float = 1.0) -> str:
+    """Fetch a path of conn's host with retries, keeping the connection open.
+
+    Unlike fetch_url, consecutive requests reuse one socket (no new TCP/TLS
+    handshake per page). Shares fetch_url's cache.
+    """
+    url = f"https://{conn.host}{path}"
+    content = read_cache(url)
+    if content is not None:
+        return content
+
+    headers = {"User-Agent": USER_AGENT}
+
+    for attempt in range(retries):
+        try:
+            conn.request("GET", path, headers=headers)
+            with conn.getresponse() as response:
+                body = response.read()
+                if response.status != 200:
+                    raise HTTPException(f"HTTP Error {response.status}: {response.reason}")
+            content = body.decode("utf-8")
+            write_cache(url, content)
+            return content
+        except (HTTPException, OSError) as e:
+            # Drop the connection, the next request reconnects
+            conn.close()
+            print(f"  Attempt {attempt + 1}/{retries} failed: {e}")
+            if attempt < retries - 1:
+                time.sleep(delay)
+
+    raise Exception(f"Failed to fetch {url} after {retries} attempts")
+
+
 # =============================================================================
 # 1. Données Québec (OQLF)
 # =============================================================================
@@ -66,15 +169,12 @@ def fetch_donnees_quebec():
     print(f"  Downloading...")
 
     try:
-        content = fetch_url(url)
-
         # Save raw file
-        output_path.write_text(content, encoding="utf-8")
+        download_url(url, output_path)
 
         # Count entries
-        lines = content.strip().split("\n")
         print(f"  Saved: {output_path}")
-        print(f"  Entries: {len(lines) - 1} (excluding header)")
+        print(f"  Entries: {count_lines(output_path) - 1} (excluding header)")
 
         return True
     except Exception as e:
@@ -89,11 +189,9 @@ def fetch_donnees_quebec():
             for resource in data.get("result", {}).get("resources", []):
                 if "termes_officialis" in resource.get("url", "").lower():
                     print(f"  Found: {resource['url']}")
-                    content = fetch_url(resource["url"])
-                    output_path.write_text(content, encoding="utf-8")
-                    lines = content.strip().split("\n")
+                    download_url(resource["url"], output_path)
                     print(f"  Saved: {output_path}")
-                    print(f"  Entries: {len(lines) - 1}")
+                    print(f"  Entries: {count_lines(output_path) - 1}")
                     return True
         except Exception as e2:
             print(f"  Alternative also failed: {e2}")
@@ -105,62 +203,56 @@ def fetch_donnees_quebec():
 # 2. Le Caméléon
 # =============================================================================
 
-class CameleonParser(HTMLParser):
-    """Parse québécismes from lecameleon.eu."""
-
-    def __init__(self):
-        super().__init__()
-        self.entries = []
-        self.current_text = []
-        self.in_content = False
-        self.capture = False
-
-    def handle_starttag(self, tag, attrs):
-        if tag in ("p", "li"):
-            self.capture = True
-            self.current_text = []
-
-    def handle_endtag(self, tag):
-        if tag in ("p", "li") and self.capture:
-            text = "".join(self.current_text).strip()
-            if text:
-                self.entries.append(text)
-            self.capture = False
-
-    def handle_data(self, data):
-        if self.capture:
-            self.current_text.append(data)
+# Site structure:
+# <span class="ecriture2">WORD </span>
+# <span class="ecriture4"> pos. </span>
+# <span class="ecriture3"> definition</span>
+CAMELEON_ENTRY_RE = re.compile(
+    r'<span class="ecriture2">([^<]+)</span>\s*<span class="ecriture4">([^<]+)</span>\s*<span class="ecriture3">([^<]*)</span>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Alternative pattern (some entries might be formatted differently)
+CAMELEON_WORD_RE = re.compile(
+    r'class="ecriture2">([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒ][A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒ\s\-\']*?)\s*</span>'
+)
+
+
+# Single entry text: WORD pos. definition
+# pos can be: n.m., n.f., vt., vi., v., adj., adv., loc., etc.
+CAMELEON_TEXT_RE = re.compile(
+    r"^([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇ][A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇ\s\-\']+)\s+(n\.m\.|n\.f\.|n\.|v\.t\.|v\.i\.|v\.|adj\.|adv\.|loc\.|prép\.|conj\.|interj\.|pron\.)\s*(.*)$",
+    re.IGNORECASE,
+)
+
+# Normalized POS
+CAMELEON_POS_MAP = {
+    "n.m.": "n.m.",
+    "n.f.": "n.f.",
+    "n.": "n.",
+    "v.t.": "v.t.",
+    "v.i.": "v.i.",
+    "v.": "v.",
+    "adj.": "adj.",
+    "adv.": "adv.",
+    "loc.": "loc.",
+    "prép.": "prép.",
+    "conj.": "conj.",
+    "interj.": "interj.",
+    "pron.": "pron.",
+}
 
 
 def parse_cameleon_entry(text: str) -> dict | None:
     """Parse a single entry like 'ACHIGAN n.m. Black-bass (poisson).'"""
-    # Pattern: WORD pos. definition
-    # pos can be: n.m., n.f., vt., vi., v., adj., adv., loc., etc.
-    pattern = r"^([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇ][A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇ\s\-\']+)\s+(n\.m\.|n\.f\.|n\.|v\.t\.|v\.i\.|v\.|adj\.|adv\.|loc\.|prép\.|conj\.|interj\.|pron\.)\s*(.*)$"
-
-    match = re.match(pattern, text.strip(), re.IGNORECASE)
+    match = CAMELEON_TEXT_RE.match(text.strip())
     if match:
         word = match.group(1).strip()
         pos = match.group(2).strip()
         definition = match.group(3).strip()
 
         # Normalize POS
-        pos_map = {
-            "n.m.": "n.m.",
-            "n.f.": "n.f.",
-            "n.": "n.",
-            "v.t.": "v.t.",
-            "v.i.": "v.i.",
-            "v.": "v.",
-            "adj.": "adj.",
-            "adv.": "adv.",
-            "loc.": "loc.",
-            "prép.": "prép.",
-            "conj.": "conj.",
-            "interj.": "interj.",
-            "pron.": "pron.",
-        }
-        pos = pos_map.get(pos.lower(), pos)
+        pos = CAMELEON_POS_MAP.get(pos.lower(), pos)
 
         return {
             "word": word.title() if word.isupper() else word,
@@ -187,25 +279,16 @@ def fetch_cameleon():
         html = fetch_url(url)
 
         entries = []
+        # Uppercased words already in entries (shared by both passes)
+        seen_upper = set()
 
-        # Site structure:
-        # <span class="ecriture2">WORD </span>
-        # <span class="ecriture4"> pos. </span>
-        # <span class="ecriture3"> definition</span>
-
-        # Pattern for the specific site structure
-        pattern = r'<span class="ecriture2">([^<]+)</span>\s*<span class="ecriture4">([^<]+)</span>\s*<span class="ecriture3">([^<]*)</span>'
-
-        for match in re.finditer(pattern, html, re.IGNORECASE | re.DOTALL):
-            word = match.group(1).strip()
-            pos = match.group(2).strip()
-            definition = match.group(3).strip()
+        for match in CAMELEON_ENTRY_RE.finditer(html):
+            word, pos, definition = match.groups()
 
             # Decode HTML entities
-            import html as html_module
-            word = html_module.unescape(word)
-            pos = html_module.unescape(pos)
-            definition = html_module.unescape(definition)
+            word = unescape(word.strip())
+            pos = unescape(pos.strip())
+            definition = unescape(definition.strip())
 
             # Skip very short
             if len(word) < 2:
@@ -221,19 +304,15 @@ def fetch_cameleon():
                 word_normalized = word_normalized.title()
 
             # Skip duplicates
-            if any(e["word"].upper() == word_normalized.upper() for e in entries):
+            key = word_normalized.upper()
+            if key in seen_upper:
                 continue
+            seen_upper.add(key)
 
-            entries.append({
-                "word": word_normalized,
-                "pos": pos.lower().strip(),
-                "definition": definition
-            })
+            entries.append((word_normalized, pos.lower().strip(), definition))
 
         # Also try alternative pattern (some entries might be formatted differently)
-        alt_pattern = r'class="ecriture2">([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒ][A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒ\s\-\']*?)\s*</span>'
-
-        for match in re.finditer(alt_pattern, html):
+        for match in CAMELEON_WORD_RE.finditer(html):
             word = match.group(1).strip()
 
             if len(word) < 2:
@@ -242,19 +321,17 @@ def fetch_cameleon():
             word_normalized = word.title() if word.isupper() else word
 
             # Skip if already found
-            if any(e["word"].upper() == word_normalized.upper() for e in entries):
+            key = word_normalized.upper()
+            if key in seen_upper:
                 continue
+            seen_upper.add(key)
 
-            entries.append({
-                "word": word_normalized,
-                "pos": "",
-                "definition": ""
-            })
+            entries.append((word_normalized, "", ""))
 
-        # Save to CSV
-        with open(output_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["word", "pos", "definition"])
-            writer.writeheader()
+        # Save to CSV (entries are (word, pos, definition) rows)
+        with open(output_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(["word", "pos", "definition"])
             writer.writerows(entries)
 
         print(f"  Saved: {output_path}")
@@ -284,7 +361,7 @@ def fetch_wiktionary():
     print("3. Wiktionary (français du Québec)")
     print("=" * 60)
 
-    base_url = "https://fr.wiktionary.org/w/api.php"
+    api_path = "/w/api.php"
     output_path = QUEBECISMES_DIR / "wiktionary_quebecismes.csv"
 
     # Categories to fetch (will be URL-encoded)
@@ -295,6 +372,9 @@ def fetch_wiktionary():
 
     all_words = set()
 
+    # One keep-alive connection for all pages of all categories
+    conn = HTTPSConnection("fr.wiktionary.org", timeout=30)
+
     for category in categories:
         print(f"  Category: {category}")
 
@@ -314,10 +394,10 @@ def fetch_wiktionary():
             if continue_token:
                 params["cmcontinue"] = continue_token
 
-            url = base_url + "?" + urlencode(params)
+            path = api_path + "?" + urlencode(params)
 
             try:
-                data = json.loads(fetch_url(url))
+                data = json.loads(fetch_path(conn, path))
 
                 members = data.get("query", {}).get("categorymembers", [])
                 for member in members:
@@ -342,14 +422,15 @@ def fetch_wiktionary():
                 print(f"    Error: {e}")
                 break
 
+    conn.close()
+
     # Save to CSV
     words_list = sorted(all_words)
 
-    with open(output_path, "w", encoding="utf-8", newline="") as f:
+    with open(output_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(["word"])
-        for word in words_list:
-            writer.writerow([word])
+        writer.writerows([word] for word in words_list)
 
     print(f"  Saved: {output_path}")
     print(f"  Total unique entries: {len(words_list)}")
@@ -361,33 +442,16 @@ def fetch_wiktionary():
 # 4. Exionnaire
 # =============================================================================
 
-class ExionnaireParser(HTMLParser):
-    """Parse québécismes list from exionnaire.com."""
-
-    def __init__(self):
-        super().__init__()
-        self.words = []
-        self.in_link = False
-        self.current_word = ""
+# Words in the list page
+EXIONNAIRE_PATTERNS = [
+    re.compile(r'href="[^"]*definir/([^"]+)"'),  # Links to definitions
+    re.compile(r'href="[^"]*titre=([^"&]+)"'),   # Title parameter
+    re.compile(r'>([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒ]{2,})</a>'),  # Uppercase words in links
+    re.compile(r'<li[^>]*>([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒ][A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒa-zàâäéèêëïîôùûüçœ\-\' ]+)'),  # Words in list items
+]
 
-    def handle_starttag(self, tag, attrs):
-        if tag == "a":
-            attrs_dict = dict(attrs)
-            href = attrs_dict.get("href", "")
-            # Links to word definitions
-            if "/definir/" in href or "titre=" in href:
-                self.in_link = True
-                self.current_word = ""
-
-    def handle_endtag(self, tag):
-        if tag == "a" and self.in_link:
-            if self.current_word.strip():
-                self.words.append(self.current_word.strip())
-            self.in_link = False
-
-    def handle_data(self, data):
-        if self.in_link:
-            self.current_word += data
+# Valid word (letters, hyphen, apostrophe, space)
+EXIONNAIRE_WORD_RE = re.compile(r"^[A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒa-zàâäéèêëïîôùûüçœ\-\' ]+$")
 
 
 def fetch_exionnaire():
@@ -430,31 +494,23 @@ def fetch_exionnaire():
 
     # Extract words from HTML
     # Look for words in links to definitions
-    patterns = [
-        r'href="[^"]*definir/([^"]+)"',  # Links to definitions
-        r'href="[^"]*titre=([^"&]+)"',   # Title parameter
-        r'>([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒ]{2,})</a>',  # Uppercase words in links
-        r'<li[^>]*>([A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒ][A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒa-zàâäéèêëïîôùûüçœ\-\' ]+)',  # Words in list items
-    ]
-
-    for pattern in patterns:
-        for match in re.finditer(pattern, html):
+    for pattern in EXIONNAIRE_PATTERNS:
+        for match in pattern.finditer(html):
             word = match.group(1).strip()
             # Decode URL encoding if needed
             word = word.replace("%20", " ").replace("_", " ")
             # Filter valid words
             if len(word) >= 2 and len(word) <= 40:
-                if re.match(r"^[A-ZÀÂÄÉÈÊËÏÎÔÙÛÜÇŒa-zàâäéèêëïîôùûüçœ\-\' ]+$", word):
+                if EXIONNAIRE_WORD_RE.match(word):
                     all_words.add(word.upper())
 
     # Save to CSV
     words_list = sorted(all_words)
 
-    with open(output_path, "w", encoding="utf-8", newline="") as f:
+    with open(output_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(["word"])
-        for word in words_list:
-            writer.writerow([word])
+        writer.writerows([word] for word in words_list)
 
     print(f"  Saved: {output_path}")
     print(f"  Total entries: {len(words_list)}")
@@ -472,25 +528,59 @@ def fetch_exionnaire():
 # Main
 # =============================================================================
 
+class ThreadOutput(io.TextIOBase):
+    """sys.stdout stand-in: threads with a buffer set write to it instead."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_captured(fetcher, output: ThreadOutput) -> tuple[bool, str]:
+    """Run a fetcher, returning its result and everything it printed."""
+    output.local.buffer = io.StringIO()
+    try:
+        return fetcher(), output.local.buffer.getvalue()
+    finally:
+        output.local.buffer = None
+
+
 def main():
     print("=" * 60)
     print("QUÉBÉCISMES FETCHER")
     print("=" * 60)
     print(f"Output directory: {QUEBECISMES_DIR}")
 
+    fetchers = {
+        "donnees_quebec": fetch_donnees_quebec,   # 1. Données Québec
+        "cameleon": fetch_cameleon,               # 2. Le Caméléon
+        "wiktionary": fetch_wiktionary,           # 3. Wiktionary
+        "exionnaire": fetch_exionnaire,           # 4. Exionnaire
+    }
     results = {}
 
-    # 1. Données Québec
-    results["donnees_quebec"] = fetch_donnees_quebec()
-
-    # 2. Le Caméléon
-    results["cameleon"] = fetch_cameleon()
-
-    # 3. Wiktionary
-    results["wiktionary"] = fetch_wiktionary()
-
-    # 4. Exionnaire
-    results["exionnaire"] = fetch_exionnaire()
+    # Sources are independent and network-bound: fetch them concurrently,
+    # each one's output buffered and printed in source order once it's done
+    output = ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = {
+                source: executor.submit(run_captured, fetcher, output)
+                for source, fetcher in fetchers.items()
+            }
+            for source, future in futures.items():
+                results[source], log = future.result()
+                output.stream.write(log)
+    finally:
+        sys.stdout = output.stream
 
     # Summary
     print("\n" + "=" * 60)
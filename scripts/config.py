@@ -4,6 +4,8 @@ Configuration for French Anki card generation pipeline.
 All paths are relative to project root (sirop-de-mots/).
 """
 
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 # =============================================================================
@@ -12,6 +14,10 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Shared top-level modules (lexique_io) are imported from the project root
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
 # Input
 LEXIQUE_PATH = PROJECT_ROOT / "Lexique383.tsv"
 
@@ -117,7 +123,7 @@ SKELETON_COLUMNS = ['French', 'WordType', 'cgram', 'freqlem', 'related_forms']
 AI_COLUMNS = ['French', 'WordType', 'Russian', 'ExampleFrench', 'ExampleRussian', 'Notes', 'Emoji']
 
 # Final Anki import columns
-ANKI_VOCABULARY_COLUMNS = ['French', 'Russian', 'WordType', 'ExampleFrench', 'ExampleRussian', 'Notes', 'Emoji', 'Audio', 'AudioExample']
+ANKI_VOCABULARY_COLUMNS = ['French', 'Russian', 'WordType', 'ExampleFrench', 'ExampleRussian', 'Notes', 'Emoji', 'Audio', 'AudioExample', 'GenderClass']
 
 # =============================================================================
 # WordType Mapping (cgram -> Anki WordType)
@@ -195,6 +201,34 @@ REQUIRED_LEXIQUE_COLUMNS = [
     'freqlemfilms2', 'freqlemlivres', 'islem', 'nbhomogr'
 ]
 
+# Lexique columns used by the pipeline scripts (a tuple: load_raw() is
+# memoized on it). Only lemma frequencies are used, so the per-form
+# freqfilms2/freqlivres columns are left out too
+LEXIQUE_COLUMNS = (
+    'ortho', 'lemme', 'cgram', 'genre', 'nombre', 'infover', 'islem',
+    'freqlemfilms2', 'freqlemlivres', 'nbhomogr',
+)
+
+
+@lru_cache(maxsize=None)
+def load_lemmas_with_freq():
+    """
+    Returns Lexique lemmas (islem == 1) with the weighted frequency 'freqlem'.
+
+    Films are weighted higher for oral comprehension (FREQ_FILMS_WEIGHT).
+    Reads LEXIQUE_COLUMNS from the shared Parquet cache (lexique_io.load_raw).
+    Memoized: callers in one process share the frame, so they must not
+    modify it in place.
+    """
+    from lexique_io import load_raw  # imported here: most users of config don't need pandas
+
+    df = load_raw(LEXIQUE_PATH, LEXIQUE_COLUMNS)
+    lemmas = df[df['islem'] == 1]
+    return lemmas.assign(freqlem=(
+        FREQ_FILMS_WEIGHT * lemmas['freqlemfilms2'].fillna(0) +
+        FREQ_BOOKS_WEIGHT * lemmas['freqlemlivres'].fillna(0)
+    ))
+
 # =============================================================================
 # Conjugation Data (for restructured conjugation cards)
 # =============================================================================
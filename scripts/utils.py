@@ -5,6 +5,10 @@ Shared utilities for French vocabulary scripts.
 import re
 from pathlib import Path
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
 # Maximum slug length to avoid filesystem issues (255 char limit minus prefix/suffix room)
 MAX_SLUG_LENGTH = 200
 
@@ -93,3 +97,57 @@ def get_audio_prefix(source_file: Path, content_dir: Path) -> str:
         return "qc_"
     else:
         return f"{parent[:4]}_"
+
+
+def write_csv(df, path: Path) -> None:
+    """Write df to CSV with pyarrow's C++ writer (no index)."""
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
+
+def read_csv(path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Read a CSV with pandas' C parser, all fields as strings ('' when empty).
+
+    With columns, returns exactly those columns ('' for ones the file lacks).
+    A zero-byte file reads as an empty frame.
+    """
+    try:
+        df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8")
+    except pd.errors.EmptyDataError:
+        df = pd.DataFrame(dtype=str)
+    if columns is not None:
+        df = df.reindex(columns=columns, fill_value="")
+    return df
+
+def to_freqlem(values: pd.Series) -> pd.Series:
+    """
+    Parse a string freqlem column into floats (0 for empty or invalid values).
+
+    astype(float) rounds like float(); pd.to_numeric can be one ULP off
+    ('42.587999999999994' -> 42.588), which reorders near-equal frequencies
+    in the freqlem sorts. It is only used to find the invalid values.
+    """
+    values = values.where(values != '', '0')
+    try:
+        return values.astype(float)
+    except ValueError:
+        valid = pd.to_numeric(values, errors='coerce').notna()
+        parsed = pd.Series(0.0, index=values.index)
+        parsed[valid] = values[valid].astype(float)
+        return parsed
+
+
+def count_lines(path: Path) -> int:
+    """
+    Count lines of a text file by counting b'\\n' in 1 MiB binary chunks.
+
+    A last line without a trailing newline counts too, like iterating the file.
+    """
+    lines = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    return lines + (last != b'\n')